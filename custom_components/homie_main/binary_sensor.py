@@ -10,7 +10,7 @@ from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -66,16 +66,20 @@ class HMNighttimeSensor(CoordinatorEntity[HomieMainCoordinator], BinarySensorEnt
             "sw_version": "0.1.0",
         }
 
-        # Track sun state changes
+        # Track sun state changes; the latest sun state is kept so a state
+        # write reads it once instead of looking it up per property
         self._unsub_sun = None
+        self._sun_state: State | None = None
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks when added to hass."""
         await super().async_added_to_hass()
+        self._sun_state = self._hass.states.get(SUN_ENTITY)
 
         @callback
         def sun_state_changed(event) -> None:
             """Handle sun state changes."""
+            self._sun_state = event.data.get("new_state")
             self.async_write_ha_state()
 
         self._unsub_sun = async_track_state_change_event(
@@ -91,7 +95,7 @@ class HMNighttimeSensor(CoordinatorEntity[HomieMainCoordinator], BinarySensorEnt
     @property
     def is_on(self) -> bool:
         """Return True if it's nighttime (sun is below horizon)."""
-        sun_state = self._hass.states.get(SUN_ENTITY)
+        sun_state = self._sun_state
         if sun_state is None:
             return False
         return sun_state.state == "below_horizon"
@@ -99,7 +103,7 @@ class HMNighttimeSensor(CoordinatorEntity[HomieMainCoordinator], BinarySensorEnt
     @property
     def extra_state_attributes(self) -> dict:
         """Return extra state attributes."""
-        sun_state = self._hass.states.get(SUN_ENTITY)
+        sun_state = self._sun_state
         if sun_state is None:
             return {}
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import logging
 import re
+from functools import lru_cache
 from typing import Any
 
 import voluptuous as vol
@@ -90,7 +91,7 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 # Email validation regex
-EMAIL_REGEX = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+EMAIL_REGEX = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", re.ASCII)
 
 
 def validate_emails(email_string: str) -> bool:
@@ -98,11 +99,275 @@ def validate_emails(email_string: str) -> bool:
     if not email_string or not email_string.strip():
         return True  # Empty is allowed
 
-    emails = [e.strip() for e in email_string.split(",") if e.strip()]
-    for email in emails:
-        if not EMAIL_REGEX.match(email):
-            return False
-    return True
+    fullmatch = EMAIL_REGEX.fullmatch
+    return all(
+        fullmatch(email)
+        for email in map(str.strip, email_string.split(","))
+        if email
+    )
+
+
+# Per-day schedule form keys: (day, enabled toggle key, time range key)
+_SCHEDULE_KEYS = tuple(
+    (day, f"schedule_{day}", f"schedule_{day}_times") for day in WEEKDAYS
+)
+
+# Default (enabled, "start-end") per day, for pre-filling the schedule fields
+_DEFAULT_SCHEDULE_FIELDS = {
+    day: (value["enabled"], f"{value['start']}-{value['end']}")
+    for day, value in DEFAULT_SCHEDULE.items()
+}
+_FALLBACK_SCHEDULE_FIELDS = (False, "09:00-17:00")
+
+
+def _parse_schedule_input(user_input: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Pop the per-day schedule fields from user_input and return the schedule."""
+    schedule = {}
+    pop = user_input.pop
+    for day, enabled_key, times_key in _SCHEDULE_KEYS:
+        # Parse time range string (e.g., "09:00-17:00")
+        start, sep, end = pop(times_key, "09:00-17:00").partition("-")
+        if not sep or "-" in end:
+            start, end = "09:00", "17:00"
+        schedule[day] = {
+            "enabled": pop(enabled_key, False),
+            "start": start.strip(),
+            "end": end.strip(),
+        }
+    return schedule
+
+
+# Selectors carry no per-form state, so a single instance is shared by every schema
+_BOOL_SELECTOR = selector.BooleanSelector(selector.BooleanSelectorConfig())
+_TEXT_SELECTOR = selector.TextSelector()
+
+# Step 1 - General
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_SITE_NAME, default=DEFAULT_SITE_NAME): str,
+        vol.Optional(CONF_ADMIN_EMAILS, default=DEFAULT_ADMIN_EMAILS): str,
+        vol.Required(CONF_LOCATION_TYPE, default=DEFAULT_LOCATION_TYPE): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=[
+                    {"value": LOCATION_HOME, "label": "Home"},
+                    {"value": LOCATION_BUSINESS, "label": "Business"},
+                ],
+                mode=selector.SelectSelectorMode.DROPDOWN,
+            )
+        ),
+        vol.Required(CONF_PUSH_ENABLED, default=DEFAULT_PUSH_ENABLED): _BOOL_SELECTOR,
+        vol.Required(CONF_PUSH_GENERAL, default=DEFAULT_PUSH_GENERAL): bool,
+        vol.Required(CONF_PUSH_ALERTS, default=DEFAULT_PUSH_ALERTS): bool,
+        vol.Required(CONF_PUSH_WARNINGS, default=DEFAULT_PUSH_WARNINGS): bool,
+        vol.Required(CONF_MAIL_ENABLED, default=DEFAULT_MAIL_ENABLED): _BOOL_SELECTOR,
+        vol.Required(CONF_MAIL_WARNINGS, default=DEFAULT_MAIL_WARNINGS): bool,
+        vol.Required(CONF_MAIL_ALERTS, default=DEFAULT_MAIL_ALERTS): bool,
+        vol.Required(CONF_PRESENCE_DETECTION, default=DEFAULT_PRESENCE_DETECTION): _BOOL_SELECTOR,
+    }
+)
+
+
+@lru_cache(maxsize=2)
+def _presence_schema(is_business: bool) -> vol.Schema:
+    """Return the Step 2 schema; the schedule option is business-only."""
+    schema_dict: dict[Any, Any] = {
+        vol.Required(CONF_USE_GPS, default=DEFAULT_USE_GPS): _BOOL_SELECTOR,
+        vol.Required(CONF_USE_WIFI, default=DEFAULT_USE_WIFI): _BOOL_SELECTOR,
+        vol.Required(CONF_USE_MOTION, default=DEFAULT_USE_MOTION): _BOOL_SELECTOR,
+        vol.Required(CONF_USE_CALENDAR, default=DEFAULT_USE_CALENDAR): _BOOL_SELECTOR,
+    }
+
+    if is_business:
+        schema_dict[vol.Required(CONF_USE_SCHEDULE, default=DEFAULT_USE_SCHEDULE)] = _BOOL_SELECTOR
+
+    return vol.Schema(schema_dict)
+
+
+@lru_cache(maxsize=32)
+def _presence_followup_schema(
+    use_gps: bool,
+    use_wifi: bool,
+    use_motion: bool,
+    use_calendar: bool,
+    use_schedule: bool,
+) -> vol.Schema:
+    """Return the Step 3 schema for the selected presence methods."""
+    schema_dict: dict[Any, Any] = {}
+
+    if use_gps:
+        # default=list hands every form a fresh empty list from the cached schema
+        schema_dict[vol.Optional(CONF_GPS_ENTITIES, default=list)] = selector.EntitySelector(
+            selector.EntitySelectorConfig(
+                domain="device_tracker",
+                multiple=True,
+            )
+        )
+        schema_dict[vol.Required(CONF_GPS_DISTANCE, default=DEFAULT_GPS_DISTANCE)] = selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=10,
+                max=5000,
+                step=10,
+                unit_of_measurement="m",
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        )
+
+    if use_wifi:
+        # WiFi presence uses ping binary_sensors
+        schema_dict[vol.Optional(CONF_PING_ENTITIES, default=list)] = selector.EntitySelector(
+            selector.EntitySelectorConfig(
+                domain="binary_sensor",
+                multiple=True,
+            )
+        )
+
+    if use_motion:
+        schema_dict[vol.Optional(CONF_MOTION_ENTITIES, default=list)] = selector.EntitySelector(
+            selector.EntitySelectorConfig(
+                domain="binary_sensor",
+                multiple=True,
+            )
+        )
+        schema_dict[vol.Required(CONF_MOTION_AWAY_HOURS, default=DEFAULT_MOTION_AWAY_HOURS)] = selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=1,
+                max=24,
+                step=1,
+                unit_of_measurement="hours",
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        )
+
+    if use_calendar:
+        schema_dict[vol.Optional(CONF_CALENDAR_ENTITIES, default=list)] = selector.EntitySelector(
+            selector.EntitySelectorConfig(
+                domain="calendar",
+                multiple=True,
+            )
+        )
+
+    # Add schedule configuration for business locations (compact: toggle + time range)
+    if use_schedule:
+        for day, enabled_key, times_key in _SCHEDULE_KEYS:
+            enabled, time_range = _DEFAULT_SCHEDULE_FIELDS.get(day, _FALLBACK_SCHEDULE_FIELDS)
+            # Toggle for enabled
+            schema_dict[vol.Required(enabled_key, default=enabled)] = _BOOL_SELECTOR
+            # Time range as string (e.g., "09:00-17:00")
+            schema_dict[vol.Optional(times_key, default=time_range)] = str
+
+    return vol.Schema(schema_dict)
+
+
+# Options flow field descriptors: (key, default, validator, required)
+_OPTIONS_NOTIFICATION_FIELDS: tuple[tuple[str, Any, Any, bool], ...] = (
+    # Push notifications master switch + sub-options
+    (CONF_PUSH_ENABLED, DEFAULT_PUSH_ENABLED, _BOOL_SELECTOR, True),
+    (CONF_PUSH_GENERAL, DEFAULT_PUSH_GENERAL, bool, True),
+    (CONF_PUSH_WARNINGS, DEFAULT_PUSH_WARNINGS, bool, True),
+    (CONF_PUSH_ALERTS, DEFAULT_PUSH_ALERTS, bool, True),
+    # Email notifications master switch + sub-options
+    (CONF_MAIL_ENABLED, DEFAULT_MAIL_ENABLED, _BOOL_SELECTOR, True),
+    (CONF_MAIL_WARNINGS, DEFAULT_MAIL_WARNINGS, bool, True),
+    (CONF_MAIL_ALERTS, DEFAULT_MAIL_ALERTS, bool, True),
+)
+
+_OPTIONS_EMAIL_FIELDS: tuple[tuple[str, Any, Any, bool], ...] = (
+    (OPT_SMTP_TO, DEFAULT_SMTP_TO, str, False),
+)
+
+# KPI mapping fields, shared by the Step 4 form and the options flow
+_KPI_FIELDS: tuple[tuple[str, Any, Any, bool], ...] = (
+    (CONF_KPI_POWER_USE, DEFAULT_KPI_POWER_USE, _TEXT_SELECTOR, False),
+    (CONF_KPI_DAY_ENERGY_USE, DEFAULT_KPI_DAY_ENERGY_USE, _TEXT_SELECTOR, False),
+    (CONF_KPI_SOLAR_POWER, DEFAULT_KPI_SOLAR_POWER, _TEXT_SELECTOR, False),
+    (CONF_KPI_SOLAR_DAY_ENERGY, DEFAULT_KPI_SOLAR_DAY_ENERGY, _TEXT_SELECTOR, False),
+    (CONF_KPI_FORECAST_USE, DEFAULT_KPI_FORECAST_USE, _TEXT_SELECTOR, False),
+    (CONF_KPI_SOLAR_FORECAST, DEFAULT_KPI_SOLAR_FORECAST, _TEXT_SELECTOR, False),
+    (CONF_KPI_PURCHASE_PRICE, DEFAULT_KPI_PURCHASE_PRICE, _TEXT_SELECTOR, False),
+)
+
+
+def _build_option_fields(
+    descriptors: tuple[tuple[str, Any, Any, bool], ...],
+    current: dict[str, Any],
+) -> dict[Any, Any]:
+    """Build schema fields from descriptors, using current values as defaults."""
+    get = current.get
+    return {
+        (vol.Required if required else vol.Optional)(key, default=get(key, default)): validator
+        for key, default, validator, required in descriptors
+    }
+
+
+# Step 4 - KPI mapping (no entry yet, so every field starts at its default)
+_KPI_SCHEMA = vol.Schema(_build_option_fields(_KPI_FIELDS, {}))
+
+
+def _build_options_schema(current: dict[str, Any]) -> vol.Schema:
+    """Build the options form schema from the merged entry data and options."""
+    # Determine which presence methods are enabled
+    get = current.get
+    presence_enabled = get(CONF_PRESENCE_DETECTION, False)
+    use_gps = get(CONF_USE_GPS, False)
+    use_wifi = get(CONF_USE_WIFI, False)
+    use_motion = get(CONF_USE_MOTION, False)
+    use_calendar = get(CONF_USE_CALENDAR, False)
+    use_schedule = get(CONF_USE_SCHEDULE, False)
+    is_business = get(CONF_LOCATION_TYPE) == LOCATION_BUSINESS
+
+    schema_dict: dict[Any, Any] = _build_option_fields(_OPTIONS_NOTIFICATION_FIELDS, current)
+
+    # Presence detection section (only show if enabled in wizard)
+    if presence_enabled:
+        if use_gps:
+            schema_dict[vol.Required(
+                CONF_USE_GPS,
+                default=use_gps,
+            )] = _BOOL_SELECTOR
+        if use_wifi:
+            schema_dict[vol.Required(
+                CONF_USE_WIFI,
+                default=use_wifi,
+            )] = _BOOL_SELECTOR
+        if use_motion:
+            schema_dict[vol.Required(
+                CONF_USE_MOTION,
+                default=use_motion,
+            )] = _BOOL_SELECTOR
+        if use_calendar:
+            schema_dict[vol.Required(
+                CONF_USE_CALENDAR,
+                default=use_calendar,
+            )] = _BOOL_SELECTOR
+
+    # Schedule configuration for business locations (compact: toggle + time range)
+    if is_business and use_schedule:
+        current_schedule = get(CONF_SCHEDULE, DEFAULT_SCHEDULE)
+        for day, enabled_key, times_key in _SCHEDULE_KEYS:
+            day_schedule = current_schedule.get(day)
+            if day_schedule is None:
+                enabled, time_range = _DEFAULT_SCHEDULE_FIELDS.get(day, _FALLBACK_SCHEDULE_FIELDS)
+            else:
+                enabled = day_schedule.get("enabled", False)
+                time_range = f"{day_schedule.get('start', '09:00')}-{day_schedule.get('end', '17:00')}"
+            # Toggle for enabled
+            schema_dict[vol.Required(
+                enabled_key,
+                default=enabled,
+            )] = _BOOL_SELECTOR
+            # Time range as string (e.g., "09:00-17:00")
+            schema_dict[vol.Optional(
+                times_key,
+                default=time_range,
+            )] = str
+
+    # Email recipient (only smtp_to is configurable, other SMTP settings are fixed)
+    schema_dict.update(_build_option_fields(_OPTIONS_EMAIL_FIELDS, current))
+
+    # KPI mappings section
+    schema_dict.update(_build_option_fields(_KPI_FIELDS, current))
+
+    return vol.Schema(schema_dict)
 
 
 class HomieMain2ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -140,39 +405,9 @@ class HomieMain2ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     # Skip to KPI mapping
                     return await self.async_step_kpi_mapping()
 
-        schema = vol.Schema(
-            {
-                vol.Required(CONF_SITE_NAME, default=DEFAULT_SITE_NAME): str,
-                vol.Optional(CONF_ADMIN_EMAILS, default=DEFAULT_ADMIN_EMAILS): str,
-                vol.Required(CONF_LOCATION_TYPE, default=DEFAULT_LOCATION_TYPE): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {"value": LOCATION_HOME, "label": "Home"},
-                            {"value": LOCATION_BUSINESS, "label": "Business"},
-                        ],
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                ),
-                vol.Required(CONF_PUSH_ENABLED, default=DEFAULT_PUSH_ENABLED): selector.BooleanSelector(
-                    selector.BooleanSelectorConfig()
-                ),
-                vol.Required(CONF_PUSH_GENERAL, default=DEFAULT_PUSH_GENERAL): bool,
-                vol.Required(CONF_PUSH_ALERTS, default=DEFAULT_PUSH_ALERTS): bool,
-                vol.Required(CONF_PUSH_WARNINGS, default=DEFAULT_PUSH_WARNINGS): bool,
-                vol.Required(CONF_MAIL_ENABLED, default=DEFAULT_MAIL_ENABLED): selector.BooleanSelector(
-                    selector.BooleanSelectorConfig()
-                ),
-                vol.Required(CONF_MAIL_WARNINGS, default=DEFAULT_MAIL_WARNINGS): bool,
-                vol.Required(CONF_MAIL_ALERTS, default=DEFAULT_MAIL_ALERTS): bool,
-                vol.Required(CONF_PRESENCE_DETECTION, default=DEFAULT_PRESENCE_DETECTION): selector.BooleanSelector(
-                    selector.BooleanSelectorConfig()
-                ),
-            }
-        )
-
         return self.async_show_form(
             step_id="user",
-            data_schema=schema,
+            data_schema=_USER_SCHEMA,
             errors=errors,
         )
 
@@ -198,34 +433,12 @@ class HomieMain2ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 # No methods selected, skip to KPI mapping
                 return await self.async_step_kpi_mapping()
 
-        # Build schema - add schedule option only for business locations
+        # Schedule option is only offered for business locations
         is_business = self._data.get(CONF_LOCATION_TYPE) == LOCATION_BUSINESS
 
-        schema_dict: dict[Any, Any] = {
-            vol.Required(CONF_USE_GPS, default=DEFAULT_USE_GPS): selector.BooleanSelector(
-                selector.BooleanSelectorConfig()
-            ),
-            vol.Required(CONF_USE_WIFI, default=DEFAULT_USE_WIFI): selector.BooleanSelector(
-                selector.BooleanSelectorConfig()
-            ),
-            vol.Required(CONF_USE_MOTION, default=DEFAULT_USE_MOTION): selector.BooleanSelector(
-                selector.BooleanSelectorConfig()
-            ),
-            vol.Required(CONF_USE_CALENDAR, default=DEFAULT_USE_CALENDAR): selector.BooleanSelector(
-                selector.BooleanSelectorConfig()
-            ),
-        }
-
-        if is_business:
-            schema_dict[vol.Required(CONF_USE_SCHEDULE, default=DEFAULT_USE_SCHEDULE)] = selector.BooleanSelector(
-                selector.BooleanSelectorConfig()
-            )
-
-        schema = vol.Schema(schema_dict)
-
         return self.async_show_form(
             step_id="presence",
-            data_schema=schema,
+            data_schema=_presence_schema(is_business),
         )
 
     async def async_step_presence_followup(
@@ -235,96 +448,20 @@ class HomieMain2ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             # Process schedule data if schedule is enabled
             if self._data.get(CONF_USE_SCHEDULE, False):
-                schedule = {}
-                for day in WEEKDAYS:
-                    # Parse time range string (e.g., "09:00-17:00")
-                    times = user_input.get(f"schedule_{day}_times", "09:00-17:00")
-                    try:
-                        start, end = times.split("-")
-                        start = start.strip()
-                        end = end.strip()
-                    except ValueError:
-                        start, end = "09:00", "17:00"
-                    schedule[day] = {
-                        "enabled": user_input.get(f"schedule_{day}", False),
-                        "start": start,
-                        "end": end,
-                    }
-                    # Remove individual keys from user_input
-                    user_input.pop(f"schedule_{day}", None)
-                    user_input.pop(f"schedule_{day}_times", None)
-                user_input[CONF_SCHEDULE] = schedule
+                user_input[CONF_SCHEDULE] = _parse_schedule_input(user_input)
 
             self._data.update(user_input)
             return await self.async_step_kpi_mapping()
 
-        # Build schema dynamically based on selected presence methods
-        schema_dict: dict[Any, Any] = {}
-
-        if self._data.get(CONF_USE_GPS, False):
-            schema_dict[vol.Optional(CONF_GPS_ENTITIES, default=[])] = selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    domain="device_tracker",
-                    multiple=True,
-                )
-            )
-            schema_dict[vol.Required(CONF_GPS_DISTANCE, default=DEFAULT_GPS_DISTANCE)] = selector.NumberSelector(
-                selector.NumberSelectorConfig(
-                    min=10,
-                    max=5000,
-                    step=10,
-                    unit_of_measurement="m",
-                    mode=selector.NumberSelectorMode.BOX,
-                )
-            )
-
-        if self._data.get(CONF_USE_WIFI, False):
-            # WiFi presence uses ping binary_sensors
-            schema_dict[vol.Optional(CONF_PING_ENTITIES, default=[])] = selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    domain="binary_sensor",
-                    multiple=True,
-                )
-            )
-
-        if self._data.get(CONF_USE_MOTION, False):
-            schema_dict[vol.Optional(CONF_MOTION_ENTITIES, default=[])] = selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    domain="binary_sensor",
-                    multiple=True,
-                )
-            )
-            schema_dict[vol.Required(CONF_MOTION_AWAY_HOURS, default=DEFAULT_MOTION_AWAY_HOURS)] = selector.NumberSelector(
-                selector.NumberSelectorConfig(
-                    min=1,
-                    max=24,
-                    step=1,
-                    unit_of_measurement="hours",
-                    mode=selector.NumberSelectorMode.BOX,
-                )
-            )
-
-        if self._data.get(CONF_USE_CALENDAR, False):
-            schema_dict[vol.Optional(CONF_CALENDAR_ENTITIES, default=[])] = selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    domain="calendar",
-                    multiple=True,
-                )
-            )
-
-        # Add schedule configuration for business locations (compact: toggle + time range)
-        if self._data.get(CONF_USE_SCHEDULE, False):
-            for day in WEEKDAYS:
-                default = DEFAULT_SCHEDULE.get(day, {"enabled": False, "start": "09:00", "end": "17:00"})
-                # Toggle for enabled
-                schema_dict[vol.Required(f"schedule_{day}", default=default["enabled"])] = selector.BooleanSelector(
-                    selector.BooleanSelectorConfig()
-                )
-                # Time range as string (e.g., "09:00-17:00")
-                time_range = f"{default['start']}-{default['end']}"
-                schema_dict[vol.Optional(f"schedule_{day}_times", default=time_range)] = str
-
-        schema = vol.Schema(schema_dict)
+        # Schema shape depends only on which presence methods are enabled
+        get = self._data.get
+        schema = _presence_followup_schema(
+            bool(get(CONF_USE_GPS, False)),
+            bool(get(CONF_USE_WIFI, False)),
+            bool(get(CONF_USE_MOTION, False)),
+            bool(get(CONF_USE_CALENDAR, False)),
+            bool(get(CONF_USE_SCHEDULE, False)),
+        )
 
         return self.async_show_form(
             step_id="presence_followup",
@@ -344,21 +481,9 @@ class HomieMain2ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 data=self._data,
             )
 
-        schema = vol.Schema(
-            {
-                vol.Optional(CONF_KPI_POWER_USE, default=DEFAULT_KPI_POWER_USE): selector.TextSelector(),
-                vol.Optional(CONF_KPI_DAY_ENERGY_USE, default=DEFAULT_KPI_DAY_ENERGY_USE): selector.TextSelector(),
-                vol.Optional(CONF_KPI_SOLAR_POWER, default=DEFAULT_KPI_SOLAR_POWER): selector.TextSelector(),
-                vol.Optional(CONF_KPI_SOLAR_DAY_ENERGY, default=DEFAULT_KPI_SOLAR_DAY_ENERGY): selector.TextSelector(),
-                vol.Optional(CONF_KPI_FORECAST_USE, default=DEFAULT_KPI_FORECAST_USE): selector.TextSelector(),
-                vol.Optional(CONF_KPI_SOLAR_FORECAST, default=DEFAULT_KPI_SOLAR_FORECAST): selector.TextSelector(),
-                vol.Optional(CONF_KPI_PURCHASE_PRICE, default=DEFAULT_KPI_PURCHASE_PRICE): selector.TextSelector(),
-            }
-        )
-
         return self.async_show_form(
             step_id="kpi_mapping",
-            data_schema=schema,
+            data_schema=_KPI_SCHEMA,
         )
 
     @staticmethod
@@ -367,7 +492,9 @@ class HomieMain2ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         config_entry: config_entries.ConfigEntry,
     ) -> HomieMain2OptionsFlow:
         """Get the options flow for this handler."""
-        return HomieMain2OptionsFlow(config_entry)
+        # The flow resolves its entry through OptionsFlow.config_entry,
+        # so the handler never holds its own reference to the entry.
+        return HomieMain2OptionsFlow()
 
 
 class HomieMain2OptionsFlow(config_entries.OptionsFlow):
@@ -377,157 +504,17 @@ class HomieMain2OptionsFlow(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the options flow."""
+        entry = self.config_entry
+        # Current values from config entry data and options, merged once per step
+        current = {**entry.data, **entry.options}
+
         if user_input is not None:
             # Process schedule data if schedule is enabled
-            current = {**self.config_entry.data, **self.config_entry.options}
             if current.get(CONF_USE_SCHEDULE, False):
-                schedule = {}
-                for day in WEEKDAYS:
-                    # Parse time range string (e.g., "09:00-17:00")
-                    times = user_input.get(f"schedule_{day}_times", "09:00-17:00")
-                    try:
-                        start, end = times.split("-")
-                        start = start.strip()
-                        end = end.strip()
-                    except ValueError:
-                        start, end = "09:00", "17:00"
-                    schedule[day] = {
-                        "enabled": user_input.get(f"schedule_{day}", False),
-                        "start": start,
-                        "end": end,
-                    }
-                    # Remove individual keys from user_input
-                    user_input.pop(f"schedule_{day}", None)
-                    user_input.pop(f"schedule_{day}_times", None)
-                user_input[CONF_SCHEDULE] = schedule
+                user_input[CONF_SCHEDULE] = _parse_schedule_input(user_input)
             return self.async_create_entry(title="", data=user_input)
 
-        # Get current values from config entry data and options
-        current = {**self.config_entry.data, **self.config_entry.options}
-
-        # Determine which presence methods are enabled
-        presence_enabled = current.get(CONF_PRESENCE_DETECTION, False)
-        use_gps = current.get(CONF_USE_GPS, False)
-        use_wifi = current.get(CONF_USE_WIFI, False)
-        use_motion = current.get(CONF_USE_MOTION, False)
-        use_calendar = current.get(CONF_USE_CALENDAR, False)
-        use_schedule = current.get(CONF_USE_SCHEDULE, False)
-        is_business = current.get(CONF_LOCATION_TYPE) == LOCATION_BUSINESS
-
-        schema_dict: dict[Any, Any] = {
-            # Push notifications master switch + sub-options
-            vol.Required(
-                CONF_PUSH_ENABLED,
-                default=current.get(CONF_PUSH_ENABLED, DEFAULT_PUSH_ENABLED),
-            ): selector.BooleanSelector(selector.BooleanSelectorConfig()),
-            vol.Required(
-                CONF_PUSH_GENERAL,
-                default=current.get(CONF_PUSH_GENERAL, DEFAULT_PUSH_GENERAL),
-            ): bool,
-            vol.Required(
-                CONF_PUSH_WARNINGS,
-                default=current.get(CONF_PUSH_WARNINGS, DEFAULT_PUSH_WARNINGS),
-            ): bool,
-            vol.Required(
-                CONF_PUSH_ALERTS,
-                default=current.get(CONF_PUSH_ALERTS, DEFAULT_PUSH_ALERTS),
-            ): bool,
-            # Email notifications master switch + sub-options
-            vol.Required(
-                CONF_MAIL_ENABLED,
-                default=current.get(CONF_MAIL_ENABLED, DEFAULT_MAIL_ENABLED),
-            ): selector.BooleanSelector(selector.BooleanSelectorConfig()),
-            vol.Required(
-                CONF_MAIL_WARNINGS,
-                default=current.get(CONF_MAIL_WARNINGS, DEFAULT_MAIL_WARNINGS),
-            ): bool,
-            vol.Required(
-                CONF_MAIL_ALERTS,
-                default=current.get(CONF_MAIL_ALERTS, DEFAULT_MAIL_ALERTS),
-            ): bool,
-        }
-
-        # Presence detection section (only show if enabled in wizard)
-        if presence_enabled:
-            if use_gps:
-                schema_dict[vol.Required(
-                    CONF_USE_GPS,
-                    default=use_gps,
-                )] = selector.BooleanSelector(selector.BooleanSelectorConfig())
-            if use_wifi:
-                schema_dict[vol.Required(
-                    CONF_USE_WIFI,
-                    default=use_wifi,
-                )] = selector.BooleanSelector(selector.BooleanSelectorConfig())
-            if use_motion:
-                schema_dict[vol.Required(
-                    CONF_USE_MOTION,
-                    default=use_motion,
-                )] = selector.BooleanSelector(selector.BooleanSelectorConfig())
-            if use_calendar:
-                schema_dict[vol.Required(
-                    CONF_USE_CALENDAR,
-                    default=use_calendar,
-                )] = selector.BooleanSelector(selector.BooleanSelectorConfig())
-
-        # Schedule configuration for business locations (compact: toggle + time range)
-        if is_business and use_schedule:
-            current_schedule = current.get(CONF_SCHEDULE, DEFAULT_SCHEDULE)
-            for day in WEEKDAYS:
-                day_schedule = current_schedule.get(day, DEFAULT_SCHEDULE.get(day, {}))
-                # Toggle for enabled
-                schema_dict[vol.Required(
-                    f"schedule_{day}",
-                    default=day_schedule.get("enabled", False),
-                )] = selector.BooleanSelector(selector.BooleanSelectorConfig())
-                # Time range as string (e.g., "09:00-17:00")
-                time_range = f"{day_schedule.get('start', '09:00')}-{day_schedule.get('end', '17:00')}"
-                schema_dict[vol.Optional(
-                    f"schedule_{day}_times",
-                    default=time_range,
-                )] = str
-
-        # Email recipient (only smtp_to is configurable, other SMTP settings are fixed)
-        schema_dict.update({
-            vol.Optional(
-                OPT_SMTP_TO,
-                default=current.get(OPT_SMTP_TO, DEFAULT_SMTP_TO),
-            ): str,
-        })
-
-        # KPI mappings section
-        schema_dict.update({
-            vol.Optional(
-                CONF_KPI_POWER_USE,
-                default=current.get(CONF_KPI_POWER_USE, DEFAULT_KPI_POWER_USE),
-            ): selector.TextSelector(),
-            vol.Optional(
-                CONF_KPI_DAY_ENERGY_USE,
-                default=current.get(CONF_KPI_DAY_ENERGY_USE, DEFAULT_KPI_DAY_ENERGY_USE),
-            ): selector.TextSelector(),
-            vol.Optional(
-                CONF_KPI_SOLAR_POWER,
-                default=current.get(CONF_KPI_SOLAR_POWER, DEFAULT_KPI_SOLAR_POWER),
-            ): selector.TextSelector(),
-            vol.Optional(
-                CONF_KPI_SOLAR_DAY_ENERGY,
-                default=current.get(CONF_KPI_SOLAR_DAY_ENERGY, DEFAULT_KPI_SOLAR_DAY_ENERGY),
-            ): selector.TextSelector(),
-            vol.Optional(
-                CONF_KPI_FORECAST_USE,
-                default=current.get(CONF_KPI_FORECAST_USE, DEFAULT_KPI_FORECAST_USE),
-            ): selector.TextSelector(),
-            vol.Optional(
-                CONF_KPI_SOLAR_FORECAST,
-                default=current.get(CONF_KPI_SOLAR_FORECAST, DEFAULT_KPI_SOLAR_FORECAST),
-            ): selector.TextSelector(),
-            vol.Optional(
-                CONF_KPI_PURCHASE_PRICE,
-                default=current.get(CONF_KPI_PURCHASE_PRICE, DEFAULT_KPI_PURCHASE_PRICE),
-            ): selector.TextSelector(),
-        })
-
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(schema_dict),
+            data_schema=_build_options_schema(current),
         )
@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+from enum import IntEnum
+
 # Domain
 DOMAIN = "homie_main"
 VERSION = "0.1.0"
@@ -170,13 +172,20 @@ LEVEL_AWARD = "Award"
 
 NOTIFICATION_LEVELS = [LEVEL_INFO, LEVEL_TIP, LEVEL_WARNING, LEVEL_ALERT, LEVEL_AWARD]
 
-# Level hierarchy for filtering (higher = more important)
-LEVEL_HIERARCHY = {
-    "info": 1,
-    "tip": 2,
-    "warning": 3,
-    "alert": 4,
-    "award": 5,
+
+class NotificationLevel(IntEnum):
+    """Notification level, ordered by importance (higher = more important)."""
+
+    INFO = 1
+    TIP = 2
+    WARNING = 3
+    ALERT = 4
+    AWARD = 5
+
+
+# Level hierarchy for filtering, keyed by lowercase level name
+LEVEL_HIERARCHY: dict[str, NotificationLevel] = {
+    level.name.lower(): level for level in NotificationLevel
 }
 
 # =============================================================================
@@ -191,9 +200,9 @@ VISUALIZATION_OPTIONS = [VIS_POWER, VIS_DAY_ENERGY, VIS_DAY_PRICE]
 # =============================================================================
 # CALENDAR KEYWORDS (for presence detection)
 # =============================================================================
-CALENDAR_HOLIDAY_KEYWORDS = ["holiday", "vakantie", "vacation"]
-CALENDAR_AWAY_KEYWORDS = ["away", "afwezig", "absent"]
-CALENDAR_GUESTS_KEYWORDS = ["guests", "gasten", "visitors"]
+CALENDAR_HOLIDAY_KEYWORDS = frozenset({"holiday", "vakantie", "vacation"})
+CALENDAR_AWAY_KEYWORDS = frozenset({"away", "afwezig", "absent"})
+CALENDAR_GUESTS_KEYWORDS = frozenset({"guests", "gasten", "visitors"})
 
 # =============================================================================
 # TIMING
@@ -5,22 +5,37 @@ from __future__ import annotations
 
 import logging
 import math
-from dataclasses import dataclass, field
+import re
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
 from datetime import datetime, time, timedelta
+from time import monotonic
 from typing import Any
 
 import aiohttp
+from yarl import URL
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback, Event, State
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from homeassistant.helpers.event import async_track_time_change, async_track_state_change_event
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_point_in_time,
+    async_track_state_change_event,
+    async_track_time_change,
+)
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 from homeassistant.const import (
     ATTR_LATITUDE,
     ATTR_LONGITUDE,
     STATE_HOME,
     STATE_NOT_HOME,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
 )
 
 from .const import (
@@ -62,12 +77,15 @@ from .const import (
     CONF_KPI_DAY_ENERGY_USE,
     CONF_KPI_SOLAR_POWER,
     CONF_KPI_SOLAR_DAY_ENERGY,
+    CONF_KPI_FORECAST_USE,
+    CONF_KPI_SOLAR_FORECAST,
     CONF_KPI_PURCHASE_PRICE,
     DEFAULT_GPS_DISTANCE,
     DEFAULT_MOTION_AWAY_HOURS,
     DEFAULT_SCHEDULE,
     LOCATION_BUSINESS,
     LOCATION_HOME,
+    WEEKDAYS,
     CALENDAR_HOLIDAY_KEYWORDS,
     CALENDAR_AWAY_KEYWORDS,
     CALENDAR_GUESTS_KEYWORDS,
@@ -83,11 +101,166 @@ from .notifications import NotificationService
 
 _LOGGER = logging.getLogger(__name__)
 
+# States that mean an entity currently has no usable value
+_UNAVAILABLE_STATES = frozenset((STATE_UNAVAILABLE, STATE_UNKNOWN))
+
 # Earth radius in meters
 EARTH_RADIUS_M = 6371000
 
+# Approximate meters per degree of latitude, for the cheap GPS bounding-box check
+METERS_PER_DEGREE = 111320.0
+# Safety margin on the bounding box so only clearly distant points skip Haversine
+GPS_PREFILTER_MARGIN = 1.2
+
+# Timeout for a single Open-Meteo request
+WEATHER_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+# Forecast URL with the static query already encoded; only lat/lon vary
+WEATHER_BASE_URL = URL(WEATHER_API_URL).with_query(
+    hourly="temperature_2m,wind_speed_10m,direct_radiation",
+    timezone=WEATHER_TIMEZONE,
+    forecast_days=WEATHER_FORECAST_DAYS,
+)
+# Forecast payloads above this size (bytes) are parsed in the executor
+WEATHER_EXECUTOR_PARSE_BYTES = 8192
+
+# Seconds to coalesce bursts of detection state changes into one recalculation
+PRESENCE_RECALC_COOLDOWN = 0.1
+
+
+# Calendar keyword groups in match priority order: (keywords, presence status)
+CALENDAR_KEYWORD_STATUSES = (
+    (CALENDAR_HOLIDAY_KEYWORDS, PRESENCE_HOLIDAY),
+    (CALENDAR_AWAY_KEYWORDS, PRESENCE_AWAY),
+    (CALENDAR_GUESTS_KEYWORDS, PRESENCE_GUESTS),
+)
+
+# All keyword groups in one case-insensitive substring pattern, one named
+# group per priority. The lookahead reports a match at every position, so
+# overlapping keywords cannot hide a higher priority one. Keywords are
+# sorted so the pattern does not depend on set iteration order.
+CALENDAR_KEYWORD_PATTERN = re.compile(
+    "(?=%s)"
+    % "|".join(
+        f"(?P<p{priority}>{'|'.join(map(re.escape, sorted(keywords)))})"
+        for priority, (keywords, _status) in enumerate(CALENDAR_KEYWORD_STATUSES)
+    ),
+    re.IGNORECASE,
+)
+
+
+def _match_calendar_status(text: str) -> str | None:
+    """Return the highest priority presence status whose keyword occurs in text."""
+    best: int | None = None
+    for match in CALENDAR_KEYWORD_PATTERN.finditer(text):
+        priority = int(match.lastgroup[1:])
+        if priority == 0:
+            # Nothing outranks the first group, stop scanning
+            best = 0
+            break
+        if best is None or priority < best:
+            best = priority
+    if best is None:
+        return None
+    return CALENDAR_KEYWORD_STATUSES[best][1]
+
+
+def _parse_schedule(schedule: dict[str, Any]) -> tuple[tuple[time, time] | None, ...]:
+    """Parse the weekday schedule into (start, end) work hours per weekday.
+
+    Indexed by datetime.weekday() (0 = Monday). Days off, and work days whose
+    times cannot be parsed, are None.
+    """
+    parsed: list[tuple[time, time] | None] = []
+    for day in WEEKDAYS:
+        day_schedule = schedule.get(day, {})
+        if not day_schedule.get("enabled", False):
+            parsed.append(None)
+            continue
+        try:
+            start_hour, start_minute = day_schedule.get("start", "09:00").split(":")
+            end_hour, end_minute = day_schedule.get("end", "17:00").split(":")
+            parsed.append(
+                (
+                    time(int(start_hour), int(start_minute)),
+                    time(int(end_hour), int(end_minute)),
+                )
+            )
+        except (ValueError, TypeError, AttributeError) as err:
+            _LOGGER.error("Error parsing schedule times for %s: %s", day, err)
+            parsed.append(None)
+    return tuple(parsed)
+
+
+def _entity_bits(entity_ids: tuple[str, ...]) -> dict[str, int]:
+    """Map each entity id to its bit in a detection bitmask."""
+    return {entity_id: 1 << index for index, entity_id in enumerate(entity_ids)}
+
+
+def _parse_price_list(raw: list) -> list[float]:
+    """Parse a purchase_prices list into a time-sorted price list."""
+    entries: list[tuple[datetime, float]] = []
+    for item in raw:
+        if not isinstance(item, dict):
+            continue
+        start_str = item.get("start")
+        price = item.get("price")
+        if start_str is None or price is None:
+            continue
+        try:
+            ts = dt_util.parse_datetime(start_str)
+            if ts is None:
+                continue
+            entries.append((ts, float(price)))
+        except (ValueError, TypeError):
+            continue
+    entries.sort(key=lambda e: e[0])
+    return [p for _, p in entries]
+
+
+# Coordinator attributes holding listener/timer unsubscribe callbacks
+_UNSUB_ATTRS = (
+    "_unsub_midnight",
+    "_unsub_motion_away_timer",
+    "_unsub_motion_standby_timer",
+    "_unsub_schedule_timer",
+    "_unsub_state_listener",
+    "_unsub_weather_timer",
+)
+
+# Operating mode lookups
+_HIBERNATION_STATUSES = frozenset({PRESENCE_AWAY, PRESENCE_HOLIDAY})
+_AT_LOCATION_STATUSES = frozenset({PRESENCE_HOME, PRESENCE_WORK})
+# Sources that confirm people are present (manual or live detection)
+_ACTIVE_SOURCES = frozenset(
+    {SOURCE_MANUAL, SOURCE_GPS, SOURCE_WIFI, SOURCE_GPS_WIFI, SOURCE_MOTION}
+)
+
+# Presence source for the detection methods that agree, indexed by a
+# (GPS << 2 | WiFi << 1 | Motion) bitmask. GPS and WiFi outrank Motion.
+DETECTION_SOURCE_BY_MASK = (
+    None,             # 0b000 - no detection
+    SOURCE_MOTION,    # 0b001
+    SOURCE_WIFI,      # 0b010
+    SOURCE_WIFI,      # 0b011
+    SOURCE_GPS,       # 0b100
+    SOURCE_GPS,       # 0b101
+    SOURCE_GPS_WIFI,  # 0b110
+    SOURCE_GPS_WIFI,  # 0b111
+)
+
+# KPI sensors (H-N in PRD)
+KPI_ENTITY_KEYS = (
+    CONF_KPI_POWER_USE,        # H - Total power use
+    CONF_KPI_DAY_ENERGY_USE,   # I - Total daily energy use
+    CONF_KPI_SOLAR_POWER,      # J - Total production
+    CONF_KPI_FORECAST_USE,     # K - Total forecasted use
+    CONF_KPI_SOLAR_DAY_ENERGY, # L - Total daily production
+    CONF_KPI_SOLAR_FORECAST,   # M - Forecast solar
+    CONF_KPI_PURCHASE_PRICE,   # N - Purchase price
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class PresenceState:
     """Represents the current presence state."""
 
@@ -97,7 +270,7 @@ class PresenceState:
     active_methods: list[str] = field(default_factory=list)  # Which methods are enabled
 
 
-@dataclass
+@dataclass(slots=True)
 class ManualOverride:
     """Represents a manual override of presence status."""
 
@@ -107,33 +280,49 @@ class ManualOverride:
     expires_at: datetime | None = None  # Next midnight
 
 
-@dataclass
-class GPSState:
-    """Tracks GPS detection state."""
+@dataclass(frozen=True, slots=True)
+class GPSConfig:
+    """GPS detection settings, fixed once zone.home has been read."""
 
+    max_distance: float = DEFAULT_GPS_DISTANCE  # meters
     home_latitude: float | None = None
     home_longitude: float | None = None
-    entities_home: set[str] = field(default_factory=set)  # GPS entities currently at home
-    max_distance: float = DEFAULT_GPS_DISTANCE  # meters
+    home_latitude_rad: float = 0.0  # Cached radians(home_latitude)
+    home_longitude_rad: float = 0.0  # Cached radians(home_longitude)
+    cos_home_latitude: float = 1.0  # Cached cos(home_latitude_rad)
+
+
+@dataclass(slots=True)
+class GPSState:
+    """Tracks GPS detection state."""
 
+    entities_home: int = 0  # Bitmask of GPS entities currently at home
 
-@dataclass
+
+@dataclass(slots=True)
 class WiFiState:
     """Tracks WiFi detection state (via ping binary_sensors)."""
 
-    entities_home: set[str] = field(default_factory=set)  # Ping entities currently responding
+    entities_home: int = 0  # Bitmask of ping entities currently responding
+
+
+@dataclass(frozen=True, slots=True)
+class MotionConfig:
+    """Motion detection settings."""
+
+    away_hours: int = DEFAULT_MOTION_AWAY_HOURS  # Hours without motion = away
 
 
-@dataclass
+@dataclass(slots=True)
 class MotionState:
     """Tracks Motion detection state."""
 
-    entities_active: set[str] = field(default_factory=set)  # Motion sensors currently detecting motion
-    last_motion: datetime | None = None  # Last time motion was detected
-    away_hours: int = DEFAULT_MOTION_AWAY_HOURS  # Hours without motion = away
+    entities_active: int = 0  # Bitmask of motion sensors currently detecting motion
+    # Last time motion was detected (monotonic seconds, immune to clock jumps)
+    last_motion: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CalendarState:
     """Tracks Calendar detection state."""
 
@@ -142,17 +331,23 @@ class CalendarState:
     expires_at: datetime | None = None  # When the current event ends
 
 
-@dataclass
-class ScheduleState:
-    """Tracks Schedule detection state (for business locations)."""
+@dataclass(frozen=True, slots=True)
+class ScheduleConfig:
+    """Schedule detection settings (for business locations)."""
 
     enabled: bool = False  # Whether schedule detection is enabled
     schedule: dict = field(default_factory=lambda: DEFAULT_SCHEDULE.copy())
+
+
+@dataclass(slots=True)
+class ScheduleState:
+    """Tracks Schedule detection state (for business locations)."""
+
     current_status: str | None = None  # "Work" or "Away" based on schedule
     is_within_hours: bool = False  # Currently within work hours
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceSeriesState:
     """Tracks price series data for day curve visualization.
 
@@ -165,9 +360,12 @@ class PriceSeriesState:
     last_updated: datetime | None = None
     purchase_prices_today: list[dict] = field(default_factory=list)  # [{"start": "...", "end": "...", "price": 0.25}, ...]
     purchase_prices_tomorrow: list[dict] = field(default_factory=list)
+    # Time-sorted prices parsed from the lists above, once per price update
+    prices_today: list[float] = field(default_factory=list)
+    prices_tomorrow: list[float] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class WeatherForecastState:
     """Tracks weather forecast data from Open-Meteo API."""
 
@@ -188,7 +386,7 @@ class WeatherForecastState:
     error: str | None = None  # Last error message if fetch failed
 
 
-@dataclass
+@dataclass(slots=True)
 class HomieMainData:
     """Data class holding all Homie Main state."""
 
@@ -201,6 +399,9 @@ class HomieMainData:
     schedule_state: ScheduleState  # Schedule detection (business only)
     price_series_state: PriceSeriesState  # 24-hour price series for visualization
     weather_state: WeatherForecastState  # Weather forecast from Open-Meteo
+    gps_config: GPSConfig = field(default_factory=GPSConfig)
+    motion_config: MotionConfig = field(default_factory=MotionConfig)
+    schedule_config: ScheduleConfig = field(default_factory=ScheduleConfig)
     location_type: str = LOCATION_HOME  # "home" or "business"
     operating_mode: str = OP_MODE_ACTIVE  # Active, Stand-by, Hibernation
     operating_mode_override: str | None = None  # Manual operating mode override
@@ -223,23 +424,58 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
         self.config_entry = entry
         self._config = {**entry.data, **entry.options}
 
+        # Resolve configured entity ids once. An options update reloads the
+        # entry, so these stay valid for the lifetime of the coordinator.
+        config = self._config
+        self._gps_entities: tuple[str, ...] = tuple(config.get(CONF_GPS_ENTITIES, ()))
+        self._ping_entities: tuple[str, ...] = tuple(config.get(CONF_PING_ENTITIES, ()))
+        self._motion_entities: tuple[str, ...] = tuple(config.get(CONF_MOTION_ENTITIES, ()))
+        self._calendar_entities: tuple[str, ...] = tuple(config.get(CONF_CALENDAR_ENTITIES, ()))
+
+        # Bit per configured detection entity, for the entities_home/active bitmasks
+        self._gps_bits = _entity_bits(self._gps_entities)
+        self._ping_bits = _entity_bits(self._ping_entities)
+        self._motion_bits = _entity_bits(self._motion_entities)
+
+        self._kpi_entities: tuple[str, ...] = tuple(
+            entity_id for key in KPI_ENTITY_KEYS if (entity_id := config.get(key))
+        )
+
+        # Entities of the enabled methods, as watched by the data gap sensors
+        self._presence_monitored: tuple[str, ...] = (
+            (self._gps_entities if config.get(CONF_USE_GPS, False) else ())
+            + (self._ping_entities if config.get(CONF_USE_WIFI, False) else ())
+            + (self._motion_entities if config.get(CONF_USE_MOTION, False) else ())
+        )
+        self._calendar_monitored: tuple[str, ...] = (
+            self._calendar_entities if config.get(CONF_USE_CALENDAR, False) else ()
+        )
+
         # Determine location type and active methods from config
         location_type = self._config.get(CONF_LOCATION_TYPE, LOCATION_HOME)
+        # Fixed for the lifetime of the entry; "at location" means Work for businesses
+        self._is_business = location_type == LOCATION_BUSINESS
+        self._at_location_status = PRESENCE_WORK if self._is_business else PRESENCE_HOME
         active_methods: list[str] = []
         if self._config.get(CONF_PRESENCE_DETECTION, False):
             if self._config.get(CONF_USE_GPS, False):
-                active_methods.append("GPS")
+                active_methods.append(SOURCE_GPS)
             if self._config.get(CONF_USE_WIFI, False):
-                active_methods.append("WiFi")
+                active_methods.append(SOURCE_WIFI)
             if self._config.get(CONF_USE_MOTION, False):
-                active_methods.append("Motion")
+                active_methods.append(SOURCE_MOTION)
             if self._config.get(CONF_USE_CALENDAR, False):
-                active_methods.append("Calendar")
-            if self._config.get(CONF_USE_SCHEDULE, False) and location_type == LOCATION_BUSINESS:
-                active_methods.append("Schedule")
+                active_methods.append(SOURCE_CALENDAR)
+            if self._config.get(CONF_USE_SCHEDULE, False) and self._is_business:
+                active_methods.append(SOURCE_SCHEDULE)
+
+        # Active methods are fixed for the lifetime of the entry
+        self._gps_enabled = SOURCE_GPS in active_methods
+        self._wifi_enabled = SOURCE_WIFI in active_methods
+        self._motion_enabled = SOURCE_MOTION in active_methods
 
         # Determine initial status based on location type
-        initial_status = PRESENCE_WORK if location_type == LOCATION_BUSINESS else PRESENCE_HOME
+        initial_status = self._at_location_status
 
         # Initialize data
         self.data = HomieMainData(
@@ -250,35 +486,59 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
                 active_methods=active_methods,
             ),
             manual_override=ManualOverride(),
-            gps_state=GPSState(
+            gps_state=GPSState(),
+            wifi_state=WiFiState(),
+            motion_state=MotionState(),
+            calendar_state=CalendarState(),
+            schedule_state=ScheduleState(),
+            price_series_state=PriceSeriesState(),
+            weather_state=WeatherForecastState(),
+            gps_config=GPSConfig(
                 max_distance=self._config.get(CONF_GPS_DISTANCE, DEFAULT_GPS_DISTANCE),
             ),
-            wifi_state=WiFiState(),
-            motion_state=MotionState(
+            motion_config=MotionConfig(
                 away_hours=int(self._config.get(CONF_MOTION_AWAY_HOURS, DEFAULT_MOTION_AWAY_HOURS)),
             ),
-            calendar_state=CalendarState(),
-            schedule_state=ScheduleState(
+            schedule_config=ScheduleConfig(
                 enabled=self._config.get(CONF_USE_SCHEDULE, False),
                 schedule=self._config.get(CONF_SCHEDULE, DEFAULT_SCHEDULE),
             ),
-            price_series_state=PriceSeriesState(),
-            weather_state=WeatherForecastState(),
             location_type=location_type,
             operating_mode=OP_MODE_ACTIVE,
             home_status_selection=initial_status,
             visualization_selection=VIS_POWER,
         )
 
+        # Schedule times are parsed once; an options update reloads the entry
+        self._parsed_schedule = _parse_schedule(self.data.schedule_config.schedule)
+
         # Track listeners for cleanup
         self._unsub_midnight: callback | None = None
-        self._unsub_gps_listeners: list[callback] = []
-        self._unsub_wifi_listeners: list[callback] = []
-        self._unsub_motion_listeners: list[callback] = []
-        self._unsub_calendar_listeners: list[callback] = []
+        self._unsub_state_listener: callback | None = None
         self._unsub_schedule_timer: callback | None = None
-        self._unsub_price_listener: callback | None = None
         self._unsub_weather_timer: callback | None = None
+        # One-shot wake-ups for the motion Stand-by and Away thresholds
+        self._unsub_motion_standby_timer: callback | None = None
+        self._unsub_motion_away_timer: callback | None = None
+
+        # State change handlers per tracked entity, served by a single subscription
+        self._entity_dispatch: dict[str, list[Callable[[Event], None]]] = {}
+
+        # Coalesce bursts of detection state changes into one recalculation
+        self._last_fingerprint: tuple = ()
+        self._recalc_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=PRESENCE_RECALC_COOLDOWN,
+            immediate=False,
+            function=self._async_recalculate_and_publish,
+        )
+
+        # Parsed KPI values per entity, with the State they were parsed from
+        self._kpi_cache: dict[str, tuple[State, float | None]] = {}
+
+        # HA's shared pooled HTTP session, so weather polls reuse connections
+        self._http = async_get_clientsession(hass)
 
         # Initialize notification service
         self.notifications = NotificationService(hass, self._config)
@@ -287,6 +547,8 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
         """Set up the coordinator."""
         _LOGGER.info("Setting up Homie Main coordinator")
 
+        self.notifications.async_setup()
+
         # Schedule midnight callback
         self._unsub_midnight = async_track_time_change(
             self.hass,
@@ -296,29 +558,33 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
             second=0,
         )
 
-        # Set up GPS detection if enabled
-        if "GPS" in self.data.presence.active_methods:
-            await self._setup_gps_detection()
-
-        # Set up WiFi detection if enabled (uses ping binary_sensors)
-        if "WiFi" in self.data.presence.active_methods:
-            await self._setup_wifi_detection()
-
-        # Set up Motion detection if enabled
-        if "Motion" in self.data.presence.active_methods:
-            await self._setup_motion_detection()
-
-        # Set up Calendar detection if enabled
-        if "Calendar" in self.data.presence.active_methods:
-            await self._setup_calendar_detection()
-
-        # Set up Schedule detection if enabled (business only)
-        if "Schedule" in self.data.presence.active_methods:
-            await self._setup_schedule_detection()
+        # Set up detection for each enabled method. WiFi uses ping binary_sensors,
+        # Schedule is business only (already filtered when building active_methods).
+        method_setups = {
+            SOURCE_GPS: self._setup_gps_detection,
+            SOURCE_WIFI: self._setup_wifi_detection,
+            SOURCE_MOTION: self._setup_motion_detection,
+            SOURCE_CALENDAR: self._setup_calendar_detection,
+            SOURCE_SCHEDULE: self._setup_schedule_detection,
+        }
+        for method in self.data.presence.active_methods:
+            await method_setups[method]()
+
+        # Recalculate once after all methods have checked their initial states
+        if self.data.presence.active_methods:
+            self._recalculate_presence()
 
         # Set up price tracking for 24h series
         await self._setup_price_tracking()
 
+        # One state change subscription for every tracked entity
+        if self._entity_dispatch:
+            self._unsub_state_listener = async_track_state_change_event(
+                self.hass,
+                list(self._entity_dispatch),
+                self._dispatch_state_change,
+            )
+
         # Set up weather forecast tracking
         await self._setup_weather_tracking()
 
@@ -328,23 +594,52 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
             self.data.presence.active_methods,
         )
 
+    def _register_state_handler(
+        self, entity_ids: tuple[str, ...], handler: Callable[[Event], None]
+    ) -> None:
+        """Register a state change handler for the given entities."""
+        for entity_id in entity_ids:
+            self._entity_dispatch.setdefault(entity_id, []).append(handler)
+
+    @callback
+    def _dispatch_state_change(self, event: Event) -> None:
+        """Dispatch a state change to the handlers registered for its entity."""
+        for handler in self._entity_dispatch.get(event.data["entity_id"], ()):
+            handler(event)
+
     async def _setup_gps_detection(self) -> None:
         """Set up GPS detection listeners."""
         # Get zone.home coordinates
         zone_home = self.hass.states.get("zone.home")
         if zone_home:
-            self.data.gps_state.home_latitude = zone_home.attributes.get(ATTR_LATITUDE)
-            self.data.gps_state.home_longitude = zone_home.attributes.get(ATTR_LONGITUDE)
+            attrs = zone_home.attributes
+            home_latitude = attrs.get(ATTR_LATITUDE)
+            home_longitude = attrs.get(ATTR_LONGITUDE)
+            gps_config = replace(
+                self.data.gps_config,
+                home_latitude=home_latitude,
+                home_longitude=home_longitude,
+            )
+            if home_latitude is not None and home_longitude is not None:
+                # Cache the home trig terms once, they are used on every GPS update
+                home_latitude_rad = math.radians(home_latitude)
+                gps_config = replace(
+                    gps_config,
+                    home_latitude_rad=home_latitude_rad,
+                    home_longitude_rad=math.radians(home_longitude),
+                    cos_home_latitude=math.cos(home_latitude_rad),
+                )
+            self.data.gps_config = gps_config
             _LOGGER.info(
                 "GPS detection enabled. Home location: %s, %s",
-                self.data.gps_state.home_latitude,
-                self.data.gps_state.home_longitude,
+                home_latitude,
+                home_longitude,
             )
         else:
             _LOGGER.warning("zone.home not found, GPS detection may not work correctly")
 
         # Get configured GPS entities
-        gps_entities = self._config.get(CONF_GPS_ENTITIES, [])
+        gps_entities = self._gps_entities
         if not gps_entities:
             _LOGGER.warning("GPS detection enabled but no GPS entities configured")
             return
@@ -352,21 +647,14 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
         _LOGGER.info("Setting up GPS listeners for: %s", gps_entities)
 
         # Check initial state of all GPS entities
+        get_state = self.hass.states.get
         for entity_id in gps_entities:
-            state = self.hass.states.get(entity_id)
+            state = get_state(entity_id)
             if state:
                 self._process_gps_state(entity_id, state)
 
-        # Set up state change listeners
-        unsub = async_track_state_change_event(
-            self.hass,
-            gps_entities,
-            self._handle_gps_state_change,
-        )
-        self._unsub_gps_listeners.append(unsub)
-
-        # Recalculate after checking initial states
-        self._recalculate_presence()
+        # Route state changes to the handler
+        self._register_state_handler(gps_entities, self._handle_gps_state_change)
 
     @callback
     def _handle_gps_state_change(self, event: Event) -> None:
@@ -377,74 +665,101 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
         if not new_state:
             return
 
-        _LOGGER.debug("GPS state change for %s: %s", entity_id, new_state.state)
-        self._process_gps_state(entity_id, new_state)
-        self._recalculate_presence()
-        self.async_set_updated_data(self.data)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("GPS state change for %s: %s", entity_id, new_state.state)
+        if self._process_gps_state(entity_id, new_state):
+            self._recalc_debouncer.async_schedule_call()
+
+    def _process_gps_state(self, entity_id: str, state: State) -> bool:
+        """Process GPS entity state and update tracking.
+
+        Returns True if the entity's at-home membership changed.
+        """
+        is_home = self._gps_is_home(entity_id, state)
+        if is_home is None:
+            return False
+
+        gps_state = self.data.gps_state
+        old_mask = gps_state.entities_home
+        bit = self._gps_bits[entity_id]
+        gps_state.entities_home = old_mask | bit if is_home else old_mask & ~bit
+        return gps_state.entities_home != old_mask
+
+    def _gps_is_home(self, entity_id: str, state: State) -> bool | None:
+        """Return whether a GPS entity is at home, or None if undetermined."""
+        value = state.state
 
-    def _process_gps_state(self, entity_id: str, state: State) -> None:
-        """Process GPS entity state and update tracking."""
         # Unavailable/unknown = can't confirm presence, treat as away
-        if state.state in ("unavailable", "unknown", None):
-            self.data.gps_state.entities_home.discard(entity_id)
-            _LOGGER.debug("GPS %s is %s, treating as away", entity_id, state.state)
-            return
+        if value in _UNAVAILABLE_STATES:
+            _LOGGER.debug("GPS %s is %s, treating as away", entity_id, value)
+            return False
 
         # Check if entity reports home/not_home directly
-        if state.state == STATE_HOME:
-            self.data.gps_state.entities_home.add(entity_id)
+        if value == STATE_HOME:
             _LOGGER.debug("GPS %s reports home", entity_id)
-            return
-        elif state.state == STATE_NOT_HOME:
-            self.data.gps_state.entities_home.discard(entity_id)
+            return True
+        elif value == STATE_NOT_HOME:
             _LOGGER.debug("GPS %s reports not_home", entity_id)
-            return
+            return False
 
         # Check by GPS coordinates if available
-        lat = state.attributes.get(ATTR_LATITUDE)
-        lon = state.attributes.get(ATTR_LONGITUDE)
+        attrs = state.attributes
+        lat = attrs.get(ATTR_LATITUDE)
+        lon = attrs.get(ATTR_LONGITUDE)
 
         if lat is None or lon is None:
             _LOGGER.debug("GPS %s has no coordinates", entity_id)
-            return
+            return None
 
-        if self.data.gps_state.home_latitude is None or self.data.gps_state.home_longitude is None:
+        gps_config = self.data.gps_config
+        home_lat = gps_config.home_latitude
+        home_lon = gps_config.home_longitude
+        if home_lat is None or home_lon is None:
             _LOGGER.debug("Home coordinates not available")
-            return
+            return None
+
+        # Cheap bounding-box check first: clearly distant points skip the trig
+        max_distance = gps_config.max_distance
+        dlat_m = abs(lat - home_lat) * METERS_PER_DEGREE
+        dlon_m = abs(lon - home_lon) * METERS_PER_DEGREE * gps_config.cos_home_latitude
+        if max(dlat_m, dlon_m) > max_distance * GPS_PREFILTER_MARGIN:
+            _LOGGER.debug("GPS %s is far from home (out of range)", entity_id)
+            return False
 
         # Calculate distance from home
-        distance = self._calculate_distance(
-            lat, lon,
-            self.data.gps_state.home_latitude,
-            self.data.gps_state.home_longitude,
-        )
+        distance = self._distance_to_home(lat, lon)
 
-        if distance <= self.data.gps_state.max_distance:
-            self.data.gps_state.entities_home.add(entity_id)
+        if distance <= max_distance:
             _LOGGER.debug("GPS %s is %.0fm from home (within range)", entity_id, distance)
-        else:
-            self.data.gps_state.entities_home.discard(entity_id)
-            _LOGGER.debug("GPS %s is %.0fm from home (out of range)", entity_id, distance)
+            return True
+        _LOGGER.debug("GPS %s is %.0fm from home (out of range)", entity_id, distance)
+        return False
+
+    def _distance_to_home(self, lat: float, lon: float) -> float:
+        """Calculate distance from home using Haversine formula.
 
-    @staticmethod
-    def _calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        """Calculate distance between two GPS coordinates using Haversine formula."""
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lon = math.radians(lon2 - lon1)
+        The home coordinates are fixed, so their radians and cosine come from
+        the cached values on GPSConfig.
+        """
+        gps_config = self.data.gps_config
+        lat_rad = math.radians(lat)
+        delta_lat = gps_config.home_latitude_rad - lat_rad
+        delta_lon = gps_config.home_longitude_rad - math.radians(lon)
 
+        sin_half_dlat = math.sin(delta_lat / 2)
+        sin_half_dlon = math.sin(delta_lon / 2)
         a = (
-            math.sin(delta_lat / 2) ** 2
-            + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2
+            sin_half_dlat * sin_half_dlat
+            + math.cos(lat_rad) * gps_config.cos_home_latitude * sin_half_dlon * sin_half_dlon
         )
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+        # 2 * asin(sqrt(a)) equals 2 * atan2(sqrt(a), sqrt(1 - a)) with one sqrt less
+        c = 2 * math.asin(math.sqrt(min(a, 1.0)))
 
         return EARTH_RADIUS_M * c
 
     async def _setup_wifi_detection(self) -> None:
         """Set up WiFi detection listeners (using ping binary_sensors)."""
-        ping_entities = self._config.get(CONF_PING_ENTITIES, [])
+        ping_entities = self._ping_entities
         if not ping_entities:
             _LOGGER.warning("WiFi detection enabled but no ping entities configured")
             return
@@ -452,21 +767,14 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
         _LOGGER.info("Setting up WiFi (ping) listeners for: %s", ping_entities)
 
         # Check initial state of all ping entities
+        get_state = self.hass.states.get
         for entity_id in ping_entities:
-            state = self.hass.states.get(entity_id)
+            state = get_state(entity_id)
             if state:
                 self._process_wifi_state(entity_id, state)
 
-        # Set up state change listeners
-        unsub = async_track_state_change_event(
-            self.hass,
-            ping_entities,
-            self._handle_wifi_state_change,
-        )
-        self._unsub_wifi_listeners.append(unsub)
-
-        # Recalculate after checking initial states
-        self._recalculate_presence()
+        # Route state changes to the handler
+        self._register_state_handler(ping_entities, self._handle_wifi_state_change)
 
     @callback
     def _handle_wifi_state_change(self, event: Event) -> None:
@@ -477,28 +785,38 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
         if not new_state:
             return
 
-        _LOGGER.debug("WiFi (ping) state change for %s: %s", entity_id, new_state.state)
-        self._process_wifi_state(entity_id, new_state)
-        self._recalculate_presence()
-        self.async_set_updated_data(self.data)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("WiFi (ping) state change for %s: %s", entity_id, new_state.state)
+        if self._process_wifi_state(entity_id, new_state):
+            self._recalc_debouncer.async_schedule_call()
+
+    def _process_wifi_state(self, entity_id: str, state: State) -> bool:
+        """Process WiFi (ping) entity state and update tracking.
+
+        Returns True if the entity's at-home membership changed.
+        """
+        wifi_state = self.data.wifi_state
+        old_mask = wifi_state.entities_home
+        bit = self._ping_bits[entity_id]
+        value = state.state
 
-    def _process_wifi_state(self, entity_id: str, state: State) -> None:
-        """Process WiFi (ping) entity state and update tracking."""
         # Ping binary_sensors: on = device responding = home, off = not responding = away
-        if state.state == "on":
-            self.data.wifi_state.entities_home.add(entity_id)
+        if value == "on":
+            wifi_state.entities_home |= bit
             _LOGGER.debug("WiFi %s is responding (home)", entity_id)
-        elif state.state == "off":
-            self.data.wifi_state.entities_home.discard(entity_id)
+        elif value == "off":
+            wifi_state.entities_home &= ~bit
             _LOGGER.debug("WiFi %s is not responding (away)", entity_id)
-        elif state.state in ("unavailable", "unknown"):
+        elif value in _UNAVAILABLE_STATES:
             # Unavailable/unknown - treat as away (device not reachable)
-            self.data.wifi_state.entities_home.discard(entity_id)
-            _LOGGER.debug("WiFi %s is %s (treating as away)", entity_id, state.state)
+            wifi_state.entities_home &= ~bit
+            _LOGGER.debug("WiFi %s is %s (treating as away)", entity_id, value)
+
+        return wifi_state.entities_home != old_mask
 
     async def _setup_motion_detection(self) -> None:
         """Set up Motion detection listeners."""
-        motion_entities = self._config.get(CONF_MOTION_ENTITIES, [])
+        motion_entities = self._motion_entities
         if not motion_entities:
             _LOGGER.warning("Motion detection enabled but no motion entities configured")
             return
@@ -506,21 +824,14 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
         _LOGGER.info("Setting up Motion listeners for: %s", motion_entities)
 
         # Check initial state of all motion entities
+        get_state = self.hass.states.get
         for entity_id in motion_entities:
-            state = self.hass.states.get(entity_id)
+            state = get_state(entity_id)
             if state:
                 self._process_motion_state(entity_id, state)
 
-        # Set up state change listeners
-        unsub = async_track_state_change_event(
-            self.hass,
-            motion_entities,
-            self._handle_motion_state_change,
-        )
-        self._unsub_motion_listeners.append(unsub)
-
-        # Recalculate after checking initial states
-        self._recalculate_presence()
+        # Route state changes to the handler
+        self._register_state_handler(motion_entities, self._handle_motion_state_change)
 
     @callback
     def _handle_motion_state_change(self, event: Event) -> None:
@@ -531,28 +842,93 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
         if not new_state:
             return
 
-        _LOGGER.debug("Motion state change for %s: %s", entity_id, new_state.state)
-        self._process_motion_state(entity_id, new_state)
-        self._recalculate_presence()
-        self.async_set_updated_data(self.data)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Motion state change for %s: %s", entity_id, new_state.state)
+        if self._process_motion_state(entity_id, new_state):
+            self._recalc_debouncer.async_schedule_call()
+
+    def _process_motion_state(self, entity_id: str, state: State) -> bool:
+        """Process Motion entity state and update tracking.
+
+        Returns True if the entity's active membership changed. A repeated
+        "on" only refreshes last_motion, which cannot change presence while
+        the sensor is still active.
+        """
+        motion_state = self.data.motion_state
+        old_mask = motion_state.entities_active
+        bit = self._motion_bits[entity_id]
+        value = state.state
 
-    def _process_motion_state(self, entity_id: str, state: State) -> None:
-        """Process Motion entity state and update tracking."""
         # Motion binary_sensors: on = motion detected = someone home
-        if state.state == "on":
-            self.data.motion_state.entities_active.add(entity_id)
-            self.data.motion_state.last_motion = dt_util.now()
+        if value == "on":
+            motion_state.entities_active |= bit
+            motion_state.last_motion = monotonic()
             _LOGGER.debug("Motion %s detected motion (home)", entity_id)
-        elif state.state == "off":
-            self.data.motion_state.entities_active.discard(entity_id)
+        elif value == "off":
+            motion_state.entities_active &= ~bit
             _LOGGER.debug("Motion %s no motion", entity_id)
-        elif state.state in ("unavailable", "unknown"):
+        elif value in _UNAVAILABLE_STATES:
             # Unavailable/unknown - ignore, don't change state
-            _LOGGER.debug("Motion %s is %s, ignoring", entity_id, state.state)
+            _LOGGER.debug("Motion %s is %s, ignoring", entity_id, value)
+
+        if motion_state.entities_active != old_mask:
+            if motion_state.entities_active:
+                self._cancel_motion_timeouts()
+            else:
+                self._arm_motion_timeouts()
+            return True
+        return False
+
+    def _cancel_motion_timeouts(self) -> None:
+        """Cancel pending motion threshold wake-ups."""
+        if self._unsub_motion_standby_timer:
+            self._unsub_motion_standby_timer()
+            self._unsub_motion_standby_timer = None
+        if self._unsub_motion_away_timer:
+            self._unsub_motion_away_timer()
+            self._unsub_motion_away_timer = None
+
+    def _arm_motion_timeouts(self) -> None:
+        """Wake up when the last motion crosses the Stand-by and Away thresholds.
+
+        Nothing else fires between those points (the schedule only wakes at
+        its boundaries), so without these the mode would not change until
+        the next unrelated update.
+        """
+        self._cancel_motion_timeouts()
+        last_motion = self.data.motion_state.last_motion
+        if last_motion is None:
+            return
+
+        away_after = self.data.motion_config.away_hours * 3600
+        elapsed = monotonic() - last_motion
+        # Thresholds are compared strictly, so wake just past each one
+        standby_delay = away_after / 2 - elapsed + 1
+        away_delay = away_after - elapsed + 1
+        if standby_delay > 0:
+            self._unsub_motion_standby_timer = async_call_later(
+                self.hass, standby_delay, self._handle_motion_standby_timeout
+            )
+        if away_delay > 0:
+            self._unsub_motion_away_timer = async_call_later(
+                self.hass, away_delay, self._handle_motion_away_timeout
+            )
+
+    @callback
+    def _handle_motion_standby_timeout(self, _now: datetime) -> None:
+        """Handle the half-timeout since the last motion (Active -> Stand-by)."""
+        self._unsub_motion_standby_timer = None
+        self._async_recalculate_and_publish()
+
+    @callback
+    def _handle_motion_away_timeout(self, _now: datetime) -> None:
+        """Handle the full timeout since the last motion (-> Away)."""
+        self._unsub_motion_away_timer = None
+        self._async_recalculate_and_publish()
 
     async def _setup_calendar_detection(self) -> None:
         """Set up Calendar detection listeners."""
-        calendar_entities = self._config.get(CONF_CALENDAR_ENTITIES, [])
+        calendar_entities = self._calendar_entities
         if not calendar_entities:
             _LOGGER.warning("Calendar detection enabled but no calendar entities configured")
             return
@@ -560,21 +936,14 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
         _LOGGER.info("Setting up Calendar listeners for: %s", calendar_entities)
 
         # Check initial state of all calendar entities
+        get_state = self.hass.states.get
         for entity_id in calendar_entities:
-            state = self.hass.states.get(entity_id)
+            state = get_state(entity_id)
             if state:
-                await self._process_calendar_state(entity_id, state)
+                self._process_calendar_state(entity_id, state)
 
-        # Set up state change listeners
-        unsub = async_track_state_change_event(
-            self.hass,
-            calendar_entities,
-            self._handle_calendar_state_change,
-        )
-        self._unsub_calendar_listeners.append(unsub)
-
-        # Recalculate after checking initial states
-        self._recalculate_presence()
+        # Route state changes to the handler
+        self._register_state_handler(calendar_entities, self._handle_calendar_state_change)
 
     @callback
     def _handle_calendar_state_change(self, event: Event) -> None:
@@ -585,63 +954,85 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
         if not new_state:
             return
 
-        _LOGGER.debug("Calendar state change for %s: %s", entity_id, new_state.state)
-        self.hass.async_create_task(self._process_calendar_state(entity_id, new_state))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Calendar state change for %s: %s", entity_id, new_state.state)
+        if self._process_calendar_state(entity_id, new_state):
+            self._recalc_debouncer.async_schedule_call()
+
+    def _process_calendar_state(self, entity_id: str, state: State) -> bool:
+        """Process Calendar entity state and update tracking.
+
+        Returns True if the calendar presence status changed.
+        """
+        calendar_state = self.data.calendar_state
+        old_status = calendar_state.current_status
 
-    async def _process_calendar_state(self, entity_id: str, state: State) -> None:
-        """Process Calendar entity state and update tracking."""
         # Calendar entities have state "on" when an event is active
         if state.state != "on":
             # No active event, clear calendar state if this was the source
-            if self.data.calendar_state.current_event:
+            if calendar_state.current_event:
                 _LOGGER.debug("Calendar %s: no active event", entity_id)
-                self.data.calendar_state.current_status = None
-                self.data.calendar_state.current_event = None
-                self.data.calendar_state.expires_at = None
-                self._recalculate_presence()
-                self.async_set_updated_data(self.data)
-            return
+                calendar_state.current_status = None
+                calendar_state.current_event = None
+                calendar_state.expires_at = None
+            return calendar_state.current_status != old_status
 
-        # Get event details from attributes
-        message = state.attributes.get("message", "").lower()
-        description = state.attributes.get("description", "").lower()
-        end_time = state.attributes.get("end_time")
+        # Get event details from attributes (either text may be missing or None)
+        attrs = state.attributes
+        message = attrs.get("message") or ""
+        description = attrs.get("description") or ""
+        end_time = attrs.get("end_time")
 
-        # Combine message and description for keyword matching
-        event_text = f"{message} {description}"
         _LOGGER.debug("Calendar %s: active event '%s'", entity_id, message)
 
-        # Check for Holiday keywords
-        if any(keyword in event_text for keyword in CALENDAR_HOLIDAY_KEYWORDS):
-            self.data.calendar_state.current_status = PRESENCE_HOLIDAY
-            self.data.calendar_state.current_event = state.attributes.get("message", "Holiday")
-            _LOGGER.info("Calendar detected Holiday: %s", self.data.calendar_state.current_event)
-
-        # Check for Away keywords
-        elif any(keyword in event_text for keyword in CALENDAR_AWAY_KEYWORDS):
-            self.data.calendar_state.current_status = PRESENCE_AWAY
-            self.data.calendar_state.current_event = state.attributes.get("message", "Away")
-            _LOGGER.info("Calendar detected Away: %s", self.data.calendar_state.current_event)
+        # Match keyword groups in priority order (Holiday > Away > Guests). Substring
+        # matching is kept on purpose so compound words ("zomervakantie") still hit.
+        status = None
+        if message or description:
+            # Combine message and description; the pattern ignores case itself
+            status = _match_calendar_status(f"{message} {description}")
 
-        # Check for Guests keywords
-        elif any(keyword in event_text for keyword in CALENDAR_GUESTS_KEYWORDS):
-            self.data.calendar_state.current_status = PRESENCE_GUESTS
-            self.data.calendar_state.current_event = state.attributes.get("message", "Guests")
-            _LOGGER.info("Calendar detected Guests: %s", self.data.calendar_state.current_event)
-
-        else:
+        if status is None:
             # No matching keywords, ignore this event
             _LOGGER.debug("Calendar %s: event '%s' has no presence keywords", entity_id, message)
-            return
+            return False
+
+        calendar_state.current_status = status
+        calendar_state.current_event = attrs.get("message") or status
+        _LOGGER.info("Calendar detected %s: %s", status, calendar_state.current_event)
 
         # Parse end time if available
         if end_time:
             try:
-                self.data.calendar_state.expires_at = dt_util.parse_datetime(end_time)
+                calendar_state.expires_at = dt_util.parse_datetime(end_time)
             except (ValueError, TypeError):
-                self.data.calendar_state.expires_at = None
+                calendar_state.expires_at = None
+
+        return status != old_status
+
+    def _presence_fingerprint(self) -> tuple:
+        """Return the outward-facing presence values, to detect real changes."""
+        data = self.data
+        return (
+            data.presence.status,
+            data.presence.source,
+            data.operating_mode,
+            data.home_status_selection,
+            data.gps_state.entities_home,
+            data.wifi_state.entities_home,
+            data.motion_state.entities_active,
+        )
 
+    @callback
+    def _async_recalculate_and_publish(self) -> None:
+        """Recalculate presence and notify listeners (debounced).
+
+        Listeners are only notified when the outcome differs from the last
+        published one, so repeated "still on" detection updates stay quiet.
+        """
         self._recalculate_presence()
+        if self._presence_fingerprint() == self._last_fingerprint:
+            return
         self.async_set_updated_data(self.data)
 
     async def _setup_schedule_detection(self) -> None:
@@ -649,74 +1040,81 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
         _LOGGER.info("Setting up Schedule detection for business location")
 
         # Check initial schedule state
-        self._evaluate_schedule()
+        now = dt_util.now()
+        self._evaluate_schedule(now)
+
+        # Only wake up again when the schedule can actually change
+        self._schedule_next_boundary(now)
+
+    def _schedule_next_boundary(self, now: datetime) -> None:
+        """Schedule the next schedule check at the next work-hours boundary.
 
-        # Set up timer to check schedule every minute
-        self._unsub_schedule_timer = async_track_time_change(
+        Boundaries are the start time, the first minute after the end time
+        (the end minute itself still counts as within hours) and midnight.
+        """
+        next_check = dt_util.start_of_local_day(now.date() + timedelta(days=1))
+
+        day_schedule = self._parsed_schedule[now.weekday()]
+        if day_schedule is not None:
+            start_time, end_time = day_schedule
+            today = now.date()
+            for boundary in (
+                datetime.combine(today, start_time, now.tzinfo),
+                datetime.combine(today, end_time, now.tzinfo) + timedelta(minutes=1),
+            ):
+                if now < boundary < next_check:
+                    next_check = boundary
+
+        self._unsub_schedule_timer = async_track_point_in_time(
             self.hass,
             self._handle_schedule_check,
-            second=0,  # Check every minute at :00
+            next_check,
         )
 
-        # Recalculate after checking initial state
-        self._recalculate_presence()
-
     @callback
     def _handle_schedule_check(self, now: datetime) -> None:
-        """Handle periodic schedule check."""
-        self._evaluate_schedule()
+        """Handle a schedule boundary."""
+        self._evaluate_schedule(now)
         self._recalculate_presence()
         self.async_set_updated_data(self.data)
+        self._schedule_next_boundary(now)
 
-    def _evaluate_schedule(self) -> None:
+    def _evaluate_schedule(self, now: datetime | None = None) -> None:
         """Evaluate current schedule state."""
-        if not self.data.schedule_state.enabled:
+        if not self.data.schedule_config.enabled:
             return
 
-        now = dt_util.now()
-        weekday = now.strftime("%A").lower()  # monday, tuesday, etc.
-        current_time = now.time()
+        schedule_state = self.data.schedule_state
 
-        schedule = self.data.schedule_state.schedule
-        day_schedule = schedule.get(weekday, {})
+        if now is None:
+            now = dt_util.now()
+        weekday = now.weekday()
 
-        if not day_schedule.get("enabled", False):
+        day_schedule = self._parsed_schedule[weekday]
+        if day_schedule is None:
             # This day is not a work day
-            self.data.schedule_state.is_within_hours = False
-            self.data.schedule_state.current_status = PRESENCE_AWAY
-            _LOGGER.debug("Schedule: %s is not a work day", weekday)
+            schedule_state.is_within_hours = False
+            schedule_state.current_status = PRESENCE_AWAY
+            _LOGGER.debug("Schedule: %s is not a work day", WEEKDAYS[weekday])
             return
 
-        # Parse start and end times
-        try:
-            start_str = day_schedule.get("start", "09:00")
-            end_str = day_schedule.get("end", "17:00")
-
-            start_parts = start_str.split(":")
-            end_parts = end_str.split(":")
-
-            start_time = time(int(start_parts[0]), int(start_parts[1]))
-            end_time = time(int(end_parts[0]), int(end_parts[1]))
-
-            # Check if current time is within work hours
-            if start_time <= current_time <= end_time:
-                self.data.schedule_state.is_within_hours = True
-                self.data.schedule_state.current_status = PRESENCE_WORK
-                _LOGGER.debug(
-                    "Schedule: within work hours (%s - %s)",
-                    start_str, end_str
-                )
-            else:
-                self.data.schedule_state.is_within_hours = False
-                self.data.schedule_state.current_status = PRESENCE_AWAY
-                _LOGGER.debug(
-                    "Schedule: outside work hours (%s - %s)",
-                    start_str, end_str
-                )
-        except (ValueError, TypeError, IndexError) as err:
-            _LOGGER.error("Error parsing schedule times: %s", err)
-            self.data.schedule_state.is_within_hours = False
-            self.data.schedule_state.current_status = None
+        start_time, end_time = day_schedule
+
+        # Check if current time is within work hours
+        if start_time <= now.time() <= end_time:
+            schedule_state.is_within_hours = True
+            schedule_state.current_status = PRESENCE_WORK
+            _LOGGER.debug(
+                "Schedule: within work hours (%s - %s)",
+                start_time, end_time
+            )
+        else:
+            schedule_state.is_within_hours = False
+            schedule_state.current_status = PRESENCE_AWAY
+            _LOGGER.debug(
+                "Schedule: outside work hours (%s - %s)",
+                start_time, end_time
+            )
 
     async def _setup_price_tracking(self) -> None:
         """Set up price tracking for day curve visualization."""
@@ -729,21 +1127,17 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
 
         # Get initial price state
         state = self.hass.states.get(price_entity)
-        if state and state.state not in ("unavailable", "unknown", None):
+        if state and state.state not in _UNAVAILABLE_STATES:
             self._update_price_from_state(state)
 
-        # Set up listener for price changes
-        self._unsub_price_listener = async_track_state_change_event(
-            self.hass,
-            [price_entity],
-            self._handle_price_change,
-        )
+        # Route price changes to the handler
+        self._register_state_handler((price_entity,), self._handle_price_change)
 
     @callback
     def _handle_price_change(self, event: Event) -> None:
         """Handle price sensor state change."""
         new_state: State | None = event.data.get("new_state")
-        if not new_state or new_state.state in ("unavailable", "unknown", None):
+        if not new_state or new_state.state in _UNAVAILABLE_STATES:
             return
 
         self._update_price_from_state(new_state)
@@ -763,18 +1157,22 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
         today = attrs.get("purchase_prices_today")
         tomorrow = attrs.get("purchase_prices_tomorrow")
 
+        price_series = self.data.price_series_state
         if isinstance(today, list):
-            self.data.price_series_state.purchase_prices_today = today
+            price_series.purchase_prices_today = today
+            price_series.prices_today = _parse_price_list(today)
         if isinstance(tomorrow, list):
-            self.data.price_series_state.purchase_prices_tomorrow = tomorrow
+            price_series.purchase_prices_tomorrow = tomorrow
+            price_series.prices_tomorrow = _parse_price_list(tomorrow)
 
     async def _setup_weather_tracking(self) -> None:
         """Set up weather forecast tracking from Open-Meteo API."""
         # Get home location from zone.home
         zone_home = self.hass.states.get("zone.home")
         if zone_home:
-            self.data.weather_state.latitude = zone_home.attributes.get(ATTR_LATITUDE)
-            self.data.weather_state.longitude = zone_home.attributes.get(ATTR_LONGITUDE)
+            attrs = zone_home.attributes
+            self.data.weather_state.latitude = attrs.get(ATTR_LATITUDE)
+            self.data.weather_state.longitude = attrs.get(ATTR_LONGITUDE)
             _LOGGER.info(
                 "Weather tracking enabled. Location: %s, %s",
                 self.data.weather_state.latitude,
@@ -810,23 +1208,23 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
             return
 
         try:
-            params = {
-                "latitude": lat,
-                "longitude": lon,
-                "hourly": "temperature_2m,wind_speed_10m,direct_radiation",
-                "timezone": WEATHER_TIMEZONE,
-                "forecast_days": WEATHER_FORECAST_DAYS,
-            }
+            url = WEATHER_BASE_URL.update_query(latitude=lat, longitude=lon)
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(WEATHER_API_URL, params=params, timeout=30) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        _LOGGER.error("Weather API error %s: %s", response.status, error_text)
-                        self.data.weather_state.error = f"API error {response.status}"
-                        return
+            async with self._http.get(url, timeout=WEATHER_REQUEST_TIMEOUT) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    _LOGGER.error("Weather API error %s: %s", response.status, error_text)
+                    self.data.weather_state.error = f"API error {response.status}"
+                    return
 
-                    data = await response.json()
+                raw = await response.read()
+
+            # HA's orjson-backed loader is much faster on the numeric arrays;
+            # large multi-day payloads are decoded off the event loop
+            if len(raw) > WEATHER_EXECUTOR_PARSE_BYTES:
+                data = await self.hass.async_add_executor_job(json_loads, raw)
+            else:
+                data = json_loads(raw)
 
             # Parse hourly data
             hourly = data.get("hourly", {})
@@ -835,45 +1233,49 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
             wind_speeds = hourly.get("wind_speed_10m", [])
             solar_radiations = hourly.get("direct_radiation", [])
 
-            # Build forecast dicts with ISO format timestamps (without seconds)
-            temp_forecast = {}
-            wind_forecast = {}
-            solar_forecast = {}
-
-            for i, time_str in enumerate(times):
-                # Convert to ISO format without seconds: "2026-01-20T08:00"
-                ts = time_str[:16] if len(time_str) >= 16 else time_str
+            # ISO format timestamps without seconds: "2026-01-20T08:00". The
+            # three dicts share these key objects; interning also lets hours
+            # that reappear in the next refresh reuse the same string
+            keys = [sys.intern(time_str[:16]) for time_str in times]
 
-                if i < len(temperatures) and temperatures[i] is not None:
-                    temp_forecast[ts] = round(temperatures[i], 1)
-                if i < len(wind_speeds) and wind_speeds[i] is not None:
-                    wind_forecast[ts] = round(wind_speeds[i], 1)
-                if i < len(solar_radiations) and solar_radiations[i] is not None:
-                    solar_forecast[ts] = round(solar_radiations[i], 1)
+            # Build forecast dicts, dropping missing hours before rounding
+            temp_forecast = {
+                ts: round(v, 1) for ts, v in zip(keys, temperatures) if v is not None
+            }
+            wind_forecast = {
+                ts: round(v, 1) for ts, v in zip(keys, wind_speeds) if v is not None
+            }
+            solar_forecast = {
+                ts: round(v, 1) for ts, v in zip(keys, solar_radiations) if v is not None
+            }
 
             # Update state
             self.data.weather_state.temperature_forecast = temp_forecast
             self.data.weather_state.wind_forecast = wind_forecast
             self.data.weather_state.solar_forecast = solar_forecast
-            self.data.weather_state.last_updated = dt_util.now()
+            now = dt_util.now()
+            self.data.weather_state.last_updated = now
             self.data.weather_state.error = None
 
             # Set current values (first entry or closest to now)
-            now_str = dt_util.now().strftime("%Y-%m-%dT%H:00")
+            # Current hour as a naive "YYYY-MM-DDTHH:00" key, matching the forecast dicts
+            now_str = now.replace(
+                minute=0, second=0, microsecond=0, tzinfo=None
+            ).isoformat(timespec="minutes")
             if now_str in temp_forecast:
                 self.data.weather_state.temperature = temp_forecast[now_str]
             elif temp_forecast:
-                self.data.weather_state.temperature = list(temp_forecast.values())[0]
+                self.data.weather_state.temperature = next(iter(temp_forecast.values()))
 
             if now_str in wind_forecast:
                 self.data.weather_state.wind_speed = wind_forecast[now_str]
             elif wind_forecast:
-                self.data.weather_state.wind_speed = list(wind_forecast.values())[0]
+                self.data.weather_state.wind_speed = next(iter(wind_forecast.values()))
 
             if now_str in solar_forecast:
                 self.data.weather_state.solar_radiation = solar_forecast[now_str]
             elif solar_forecast:
-                self.data.weather_state.solar_radiation = list(solar_forecast.values())[0]
+                self.data.weather_state.solar_radiation = next(iter(solar_forecast.values()))
 
             _LOGGER.info(
                 "Weather forecast updated: %d temperature, %d wind, %d solar entries",
@@ -896,54 +1298,52 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
             return None
 
         state = self.hass.states.get(entity_id)
-        if not state or state.state in ("unavailable", "unknown", None):
+        if not state:
             return None
 
-        try:
-            return float(state.state)
-        except (ValueError, TypeError):
-            return None
-
-    async def async_shutdown(self) -> None:
-        """Shut down the coordinator."""
-        if self._unsub_midnight:
-            self._unsub_midnight()
-            self._unsub_midnight = None
-
-        if self._unsub_schedule_timer:
-            self._unsub_schedule_timer()
-            self._unsub_schedule_timer = None
+        # HA replaces the State object on every change, so identity marks a new value
+        cached = self._kpi_cache.get(entity_id)
+        if cached is not None and cached[0] is state:
+            return cached[1]
 
-        if self._unsub_price_listener:
-            self._unsub_price_listener()
-            self._unsub_price_listener = None
-
-        if self._unsub_weather_timer:
-            self._unsub_weather_timer()
-            self._unsub_weather_timer = None
+        value: float | None = None
+        if state.state not in _UNAVAILABLE_STATES:
+            try:
+                value = float(state.state)
+            except (ValueError, TypeError):
+                value = None
 
-        for unsub in self._unsub_gps_listeners:
-            unsub()
-        self._unsub_gps_listeners.clear()
+        self._kpi_cache[entity_id] = (state, value)
+        return value
 
-        for unsub in self._unsub_wifi_listeners:
-            unsub()
-        self._unsub_wifi_listeners.clear()
+    async def async_shutdown(self) -> None:
+        """Shut down the coordinator."""
+        self._recalc_debouncer.async_shutdown()
+        await self.notifications.async_shutdown()
 
-        for unsub in self._unsub_motion_listeners:
-            unsub()
-        self._unsub_motion_listeners.clear()
+        for attr in _UNSUB_ATTRS:
+            unsub = getattr(self, attr)
+            if unsub:
+                unsub()
+                setattr(self, attr, None)
 
-        for unsub in self._unsub_calendar_listeners:
-            unsub()
-        self._unsub_calendar_listeners.clear()
+        self._entity_dispatch.clear()
 
     @callback
     def _handle_midnight(self, now: datetime) -> None:
         """Handle midnight - allow override again."""
+        override = self.data.manual_override
+        if not override.active:
+            # No override to release; only publish if the day change itself
+            # moved the presence result
+            self._recalculate_presence()
+            if self._presence_fingerprint() != self._last_fingerprint:
+                self.async_set_updated_data(self.data)
+            return
+
         _LOGGER.info("Midnight reached, override can be changed again")
-        self.data.manual_override.active = False
-        self.data.manual_override.expires_at = None
+        override.active = False
+        override.expires_at = None
         self._recalculate_presence()
         self.async_set_updated_data(self.data)
 
@@ -952,15 +1352,18 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
         previous = self.data.home_status_selection
 
         now = dt_util.now()
-        tomorrow = now.date() + __import__("datetime").timedelta(days=1)
-        midnight = dt_util.as_local(
-            datetime.combine(tomorrow, time.min)
-        )
+        tomorrow = now.date() + timedelta(days=1)
+        midnight = dt_util.start_of_local_day(tomorrow)
+
+        override = self.data.manual_override
+        if override.active and override.status == status and override.expires_at == midnight:
+            # Same override re-selected, nothing to recalculate or publish
+            return
 
-        self.data.manual_override.active = True
-        self.data.manual_override.status = status
-        self.data.manual_override.previous_status = previous
-        self.data.manual_override.expires_at = midnight
+        override.active = True
+        override.status = status
+        override.previous_status = previous
+        override.expires_at = midnight
         self.data.home_status_selection = status
         _LOGGER.info("Home status set to '%s' until %s (previous: %s)", status, midnight, previous)
 
@@ -969,6 +1372,10 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
 
     def clear_manual_override(self) -> None:
         """Clear the manual override - allow changing again."""
+        if not self.data.manual_override.active:
+            # Nothing to clear, skip the recalculation and update
+            return
+
         self.data.manual_override.active = False
         self.data.manual_override.expires_at = None
         _LOGGER.info("Manual override cleared, can be changed again")
@@ -977,6 +1384,8 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
 
     def set_visualization(self, selection: str) -> None:
         """Set the visualization mode."""
+        if self.data.visualization_selection == selection:
+            return
         self.data.visualization_selection = selection
         self.async_set_updated_data(self.data)
 
@@ -986,6 +1395,10 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
         Note: This will be cleared when presence status changes,
         as presence changes always override manual operating mode input.
         """
+        if self.data.operating_mode_override == mode and self.data.operating_mode == mode:
+            # Same override re-selected, listeners already have this state
+            return
+
         self.data.operating_mode_override = mode
         self.data.operating_mode = mode
         _LOGGER.info("Operating mode manually set to: %s", mode)
@@ -1002,10 +1415,7 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
         5. LastKnown
         """
         now = dt_util.now()
-        is_business = self.data.location_type == LOCATION_BUSINESS
-
-        # Determine the "at location" status based on location type
-        at_location_status = PRESENCE_WORK if is_business else PRESENCE_HOME
+        at_location_status = self._at_location_status
 
         # Priority 1: Manual override (when active/locked)
         if self.data.manual_override.active:
@@ -1016,9 +1426,9 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
             return
 
         # Priority 2: Detection (GPS, WiFi, Motion) - overrules calendar and schedule
-        gps_enabled = "GPS" in self.data.presence.active_methods
-        wifi_enabled = "WiFi" in self.data.presence.active_methods
-        motion_enabled = "Motion" in self.data.presence.active_methods
+        gps_enabled = self._gps_enabled
+        wifi_enabled = self._wifi_enabled
+        motion_enabled = self._motion_enabled
 
         gps_home = bool(self.data.gps_state.entities_home) if gps_enabled else False
         wifi_home = bool(self.data.wifi_state.entities_home) if wifi_enabled else False
@@ -1029,42 +1439,23 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
         if motion_enabled:
             if self.data.motion_state.entities_active:
                 motion_home = True
-            elif self.data.motion_state.last_motion:
-                timeout = timedelta(hours=self.data.motion_state.away_hours)
-                if now - self.data.motion_state.last_motion > timeout:
+            elif self.data.motion_state.last_motion is not None:
+                since_motion = monotonic() - self.data.motion_state.last_motion
+                if since_motion > self.data.motion_config.away_hours * 3600:
                     motion_away = True
-                    _LOGGER.debug(
-                        "Motion timeout expired: last motion %s, threshold %s hours",
-                        self.data.motion_state.last_motion,
-                        self.data.motion_state.away_hours,
-                    )
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug(
+                            "Motion timeout expired: last motion %.0fs ago, threshold %s hours",
+                            since_motion,
+                            self.data.motion_config.away_hours,
+                        )
 
         # Check if at least one detection method says "at location"
         if gps_home or wifi_home or motion_home:
             self.data.presence.status = at_location_status
-            sources = []
-            if gps_home:
-                sources.append("GPS")
-            if wifi_home:
-                sources.append("WiFi")
-            if motion_home:
-                sources.append("Motion")
-
-            if len(sources) == 1:
-                if sources[0] == "GPS":
-                    self.data.presence.source = SOURCE_GPS
-                elif sources[0] == "WiFi":
-                    self.data.presence.source = SOURCE_WIFI
-                else:
-                    self.data.presence.source = SOURCE_MOTION
-            elif "GPS" in sources and "WiFi" in sources:
-                self.data.presence.source = SOURCE_GPS_WIFI
-            elif "GPS" in sources:
-                self.data.presence.source = SOURCE_GPS
-            elif "WiFi" in sources:
-                self.data.presence.source = SOURCE_WIFI
-            else:
-                self.data.presence.source = SOURCE_MOTION
+            self.data.presence.source = DETECTION_SOURCE_BY_MASK[
+                gps_home << 2 | wifi_home << 1 | motion_home
+            ]
 
             self.data.presence.last_updated = now
             self.data.home_status_selection = at_location_status
@@ -1072,9 +1463,9 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
             return
 
         # Check if detection says away
-        gps_entities = self._config.get(CONF_GPS_ENTITIES, []) if gps_enabled else []
-        wifi_entities = self._config.get(CONF_PING_ENTITIES, []) if wifi_enabled else []
-        motion_entities = self._config.get(CONF_MOTION_ENTITIES, []) if motion_enabled else []
+        gps_entities = self._gps_entities if gps_enabled else ()
+        wifi_entities = self._ping_entities if wifi_enabled else ()
+        motion_entities = self._motion_entities if motion_enabled else ()
 
         gps_says_away = bool(gps_entities) and not gps_home
         wifi_says_away = bool(wifi_entities) and not wifi_home
@@ -1096,14 +1487,9 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
 
             # No calendar override, just Away
             self.data.presence.status = PRESENCE_AWAY
-            if gps_says_away and wifi_says_away:
-                self.data.presence.source = SOURCE_GPS_WIFI
-            elif gps_says_away:
-                self.data.presence.source = SOURCE_GPS
-            elif wifi_says_away:
-                self.data.presence.source = SOURCE_WIFI
-            else:
-                self.data.presence.source = SOURCE_MOTION
+            self.data.presence.source = DETECTION_SOURCE_BY_MASK[
+                gps_says_away << 2 | wifi_says_away << 1 | motion_says_away
+            ]
             self.data.presence.last_updated = now
             self.data.home_status_selection = PRESENCE_AWAY
             self._update_operating_mode()
@@ -1119,7 +1505,7 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
             return
 
         # Priority 4: Schedule (for business locations)
-        if self.data.schedule_state.enabled and self.data.schedule_state.current_status:
+        if self.data.schedule_config.enabled and self.data.schedule_state.current_status:
             self.data.presence.status = self.data.schedule_state.current_status
             self.data.presence.source = SOURCE_SCHEDULE
             self.data.presence.last_updated = now
@@ -1150,10 +1536,9 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
             self.data.operating_mode_override = None
 
         presence = self.data.presence.status
-        is_business = self.data.location_type == LOCATION_BUSINESS
 
         # Hibernation: Away, Holiday, or Guests (for home locations)
-        if presence in (PRESENCE_AWAY, PRESENCE_HOLIDAY):
+        if presence in _HIBERNATION_STATUSES:
             self.data.operating_mode = OP_MODE_HIBERNATION
             return
 
@@ -1163,14 +1548,14 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
             return
 
         # At location (Home or Work)
-        at_location = presence in (PRESENCE_HOME, PRESENCE_WORK)
+        at_location = presence in _AT_LOCATION_STATUSES
 
         if at_location:
             # Check if we have active detection indicating people
             source = self.data.presence.source
 
             # Manual, Detection sources = Active (people confirmed)
-            if source in (SOURCE_MANUAL, SOURCE_GPS, SOURCE_WIFI, SOURCE_GPS_WIFI, SOURCE_MOTION):
+            if source in _ACTIVE_SOURCES:
                 self.data.operating_mode = OP_MODE_ACTIVE
                 return
 
@@ -1182,13 +1567,10 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
 
             # Calendar or LastKnown with at location status
             # Check motion state to determine activity level
-            motion_enabled = "Motion" in self.data.presence.active_methods
-            if motion_enabled and self.data.motion_state.last_motion:
-                now = dt_util.now()
-                timeout = timedelta(hours=self.data.motion_state.away_hours)
-                half_timeout = timeout / 2
+            if self._motion_enabled and self.data.motion_state.last_motion is not None:
+                half_timeout = self.data.motion_config.away_hours * 3600 / 2
 
-                time_since_motion = now - self.data.motion_state.last_motion
+                time_since_motion = monotonic() - self.data.motion_state.last_motion
 
                 if time_since_motion < half_timeout:
                     # Recent motion = Active
@@ -1205,6 +1587,12 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
         # Fallback
         self.data.operating_mode = OP_MODE_STANDBY
 
+    @callback
+    def async_set_updated_data(self, data: HomieMainData) -> None:
+        """Publish data, remembering what was published for change detection."""
+        self._last_fingerprint = self._presence_fingerprint()
+        super().async_set_updated_data(data)
+
     async def _async_update_data(self) -> HomieMainData:
         """Fetch data - called by coordinator refresh."""
         return self.data
@@ -1214,6 +1602,27 @@ class HomieMainCoordinator(DataUpdateCoordinator[HomieMainData]):
         """Return the current config."""
         return self._config
 
+    @callback
+    def set_config_value(self, key: str, value: Any) -> None:
+        """Update a cached config value ahead of the entry reload."""
+        self._config[key] = value
+        self.notifications.invalidate_dispatch_policy()
+
+    @property
+    def presence_monitored_entities(self) -> tuple[str, ...]:
+        """Return the entities of the enabled GPS, WiFi and Motion methods."""
+        return self._presence_monitored
+
+    @property
+    def calendar_monitored_entities(self) -> tuple[str, ...]:
+        """Return the calendar entities if calendar detection is enabled."""
+        return self._calendar_monitored
+
+    @property
+    def kpi_monitored_entities(self) -> tuple[str, ...]:
+        """Return the configured KPI entities."""
+        return self._kpi_entities
+
     async def send_notification(
         self,
         title: str,
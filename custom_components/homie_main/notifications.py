@@ -4,14 +4,25 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import html
 import logging
-import smtplib
-import ssl
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from email.message import EmailMessage
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+import aiosmtplib
+
+from homeassistant.const import (
+    ATTR_DOMAIN,
+    EVENT_HOMEASSISTANT_STOP,
+    EVENT_SERVICE_REGISTERED,
+    EVENT_SERVICE_REMOVED,
+)
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util.ssl import client_context
 
 from .const import (
     LEVEL_INFO,
@@ -20,6 +31,7 @@ from .const import (
     LEVEL_ALERT,
     LEVEL_AWARD,
     LEVEL_HIERARCHY,
+    NotificationLevel,
     OPT_SMTP_HOST,
     OPT_SMTP_PORT,
     OPT_SMTP_SSL,
@@ -52,6 +64,67 @@ LEVEL_EMOJI = {
     LEVEL_AWARD: "🏆",
 }
 
+# Config switch gating each level; levels missing from a table are never
+# sent on that channel
+PUSH_CONFIG_KEY_BY_LEVEL: dict[NotificationLevel, str] = {
+    NotificationLevel.ALERT: CONF_PUSH_ALERTS,
+    NotificationLevel.WARNING: CONF_PUSH_WARNINGS,
+    NotificationLevel.INFO: CONF_PUSH_GENERAL,
+    NotificationLevel.TIP: CONF_PUSH_GENERAL,
+    NotificationLevel.AWARD: CONF_PUSH_GENERAL,
+}
+# Only warnings and alerts can trigger emails
+MAIL_CONFIG_KEY_BY_LEVEL: dict[NotificationLevel, str] = {
+    NotificationLevel.ALERT: CONF_MAIL_ALERTS,
+    NotificationLevel.WARNING: CONF_MAIL_WARNINGS,
+}
+
+# Seconds an idle SMTP session is reused before reconnecting
+SMTP_IDLE_TIMEOUT = 60
+# Messages sent on one SMTP session before it is rotated (servers cap this)
+SMTP_MAX_MESSAGES_PER_SESSION = 100
+# Emails that may wait for the background sender before new ones are dropped
+EMAIL_QUEUE_SIZE = 256
+# Seconds shutdown waits for queued emails to be sent
+EMAIL_DRAIN_TIMEOUT = 10
+
+# HTML email body with black/white styling
+EMAIL_HTML_TEMPLATE = """
+        <html>
+        <body style="font-family: Arial, sans-serif; padding: 20px; color: #000;">
+            <p style="color: #666; font-size: 11px; margin-bottom: 20px;">
+                This is an auto-generated email, please do not reply.
+            </p>
+            <div style="border-left: 4px solid #000; padding-left: 15px;">
+                <h2 style="color: #000; margin: 0 0 10px 0;">{title}</h2>
+                <p style="color: #333; line-height: 1.6;">{message}</p>
+            </div>
+            <hr style="border: none; border-top: 1px solid #ccc; margin: 20px 0;">
+            <p style="color: #999; font-size: 12px;">
+                Automatisch verzonden vanuit Homie, a.u.b. niet reageren.
+            </p>
+        </body>
+        </html>
+        """
+
+
+@dataclass(frozen=True, slots=True)
+class NotifyDispatchPolicy:
+    """Levels that are sent on each channel."""
+
+    push: frozenset[NotificationLevel]
+    email: frozenset[NotificationLevel]
+
+
+def _notification_id(title: str, message: str) -> str:
+    """Return a stable persistent notification id for a title/message pair.
+
+    Unlike hash(), the digest is the same across restarts, and 48 bits make
+    accidental overwrites of unrelated notifications practically impossible.
+    """
+    digest = hashlib.blake2b(f"{title}\0{message}".encode(), digest_size=6)
+    return f"homie_main_{digest.hexdigest()}"
+
 
 class NotificationService:
     """Service for sending notifications via email and push."""
@@ -61,32 +134,121 @@ class NotificationService:
         self.hass = hass
         self._config = config
 
-    def _should_send_push(self, level: str) -> bool:
-        """Check if push notification should be sent for this level."""
-        level_lower = level.lower()
-        level_value = LEVEL_HIERARCHY.get(level_lower, 0)
+        # Levels enabled per channel, resolved from the config on first use
+        self._dispatch_policy: NotifyDispatchPolicy | None = None
+
+        # mobile_app notify services, rebuilt lazily after a notify service
+        # is registered or removed (None = needs a rescan)
+        self._mobile_services: list[str] | None = None
+        self._unsub_service_events: list[Callable[[], None]] = []
+        self._unsub_stop: Callable[[], None] | None = None
+
+        # SMTP session reused across emails while it stays fresh
+        self._smtp: aiosmtplib.SMTP | None = None
+        self._smtp_key: tuple[str, int, bool, bool, str] | None = None
+        self._smtp_last_used = 0.0
+        self._smtp_messages = 0
+        self._smtp_lock = asyncio.Lock()
+
+        # Emails waiting for the background sender: (title, message, level)
+        self._email_queue: asyncio.Queue[tuple[str, str, str]] = asyncio.Queue(
+            maxsize=EMAIL_QUEUE_SIZE
+        )
+        self._email_worker: asyncio.Task[None] | None = None
+
+    @callback
+    def async_setup(self) -> None:
+        """Start tracking notify service (un)registration and HA stop."""
+        for event_type in (EVENT_SERVICE_REGISTERED, EVENT_SERVICE_REMOVED):
+            self._unsub_service_events.append(
+                self.hass.bus.async_listen(event_type, self._handle_service_event)
+            )
+        # Entries are not unloaded on stop, so close the SMTP session here too
+        self._unsub_stop = self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_handle_stop
+        )
+        self._email_worker = self.hass.async_create_background_task(
+            self._async_email_worker(), "homie_main email sender"
+        )
 
-        # Check config settings
-        if level_lower in ("alert",) and self._config.get(CONF_PUSH_ALERTS, True):
-            return True
-        if level_lower in ("warning",) and self._config.get(CONF_PUSH_WARNINGS, True):
-            return True
-        if level_lower in ("info", "tip", "award") and self._config.get(CONF_PUSH_GENERAL, True):
-            return True
+    async def _async_handle_stop(self, event: Event) -> None:
+        """Shut down when Home Assistant stops."""
+        # A fired listen_once listener is already removed
+        self._unsub_stop = None
+        await self.async_shutdown()
+
+    async def async_shutdown(self) -> None:
+        """Stop tracking notify services and close the SMTP session."""
+        for unsub in self._unsub_service_events:
+            unsub()
+        self._unsub_service_events.clear()
+        if self._unsub_stop:
+            self._unsub_stop()
+            self._unsub_stop = None
+
+        worker, self._email_worker = self._email_worker, None
+        if worker is not None:
+            # Give queued emails a chance to go out before stopping the sender
+            try:
+                await asyncio.wait_for(self._email_queue.join(), EMAIL_DRAIN_TIMEOUT)
+            except asyncio.TimeoutError:
+                _LOGGER.warning(
+                    "Dropping %d unsent email notification(s) on shutdown",
+                    self._email_queue.qsize(),
+                )
+            worker.cancel()
+
+        if self._smtp is not None:
+            async with self._smtp_lock:
+                await self._close_smtp_client()
+
+    @callback
+    def _handle_service_event(self, event: Event) -> None:
+        """Invalidate the mobile app service cache on notify service changes."""
+        if event.data.get(ATTR_DOMAIN) == "notify":
+            self._mobile_services = None
+
+    def _get_mobile_services(self) -> list[str]:
+        """Return the mobile app notify services, scanning only when stale."""
+        if self._mobile_services is None:
+            self._mobile_services = [
+                service
+                for service in self.hass.services.async_services().get("notify", {})
+                if service.startswith("mobile_app_")
+            ]
+        return self._mobile_services
+
+    @callback
+    def invalidate_dispatch_policy(self) -> None:
+        """Drop the cached dispatch policy after a notification setting changed."""
+        self._dispatch_policy = None
+
+    def _get_dispatch_policy(self) -> NotifyDispatchPolicy:
+        """Return the per-level channel policy, resolving the config only when stale."""
+        policy = self._dispatch_policy
+        if policy is None:
+            config = self._config
+            policy = self._dispatch_policy = NotifyDispatchPolicy(
+                push=frozenset(
+                    level
+                    for level, config_key in PUSH_CONFIG_KEY_BY_LEVEL.items()
+                    if config.get(config_key, True)
+                ),
+                email=frozenset(
+                    level
+                    for level, config_key in MAIL_CONFIG_KEY_BY_LEVEL.items()
+                    if config.get(config_key, True)
+                ),
+            )
+        return policy
 
-        return False
+    def _should_send_push(self, level: NotificationLevel | None) -> bool:
+        """Check if push notification should be sent for this level."""
+        return level in self._get_dispatch_policy().push
 
-    def _should_send_email(self, level: str) -> bool:
+    def _should_send_email(self, level: NotificationLevel | None) -> bool:
         """Check if email notification should be sent for this level."""
-        level_lower = level.lower()
-
-        # Only warnings and alerts can trigger emails
-        if level_lower == "alert" and self._config.get(CONF_MAIL_ALERTS, True):
-            return True
-        if level_lower == "warning" and self._config.get(CONF_MAIL_WARNINGS, True):
-            return True
-
-        return False
+        return level in self._get_dispatch_policy().email
 
     async def send_notification(
         self,
@@ -106,25 +268,46 @@ class NotificationService:
             email: Override email setting (None = use config)
 
         Returns:
-            Dict with results for each channel
+            Dict with results for each channel; email is handed to the
+            background sender, so email_sent stays False and email_queued
+            reports whether it was accepted for sending
         """
         results: dict[str, Any] = {
             "push_sent": False,
             "email_sent": False,
+            "email_queued": False,
             "push_error": None,
             "email_error": None,
         }
 
+        # Resolve the level name once; unknown levels are sent on no channel
+        level_value = LEVEL_HIERARCHY.get(level.lower())
+
+        # Determine if we should send; most filtered levels stop here
+        should_push = push if push is not None else self._should_send_push(level_value)
+        should_email = email if email is not None else self._should_send_email(level_value)
+        if not (should_push or should_email):
+            return results
+
         emoji = LEVEL_EMOJI.get(level, "")
 
         # Format title: "Homie - 🚨 Title"
         full_title = f"Homie - {emoji} {title}".strip()
 
-        # Determine if we should send
-        should_push = push if push is not None else self._should_send_push(level)
-        should_email = email if email is not None else self._should_send_email(level)
+        if should_email and self._email_worker is None:
+            # Not set up yet or already shut down; nothing would send it
+            results["email_error"] = "Email sender not running"
+            _LOGGER.error("Email sender not running, dropping email notification: %s", title)
+        elif should_email:
+            # Queued for the background sender, so the SMTP round trip stays
+            # off the caller and overlaps the notify service calls
+            try:
+                self._email_queue.put_nowait((full_title, message, level))
+                results["email_queued"] = True
+            except asyncio.QueueFull:
+                results["email_error"] = "Email queue full"
+                _LOGGER.error("Email queue full, dropping email notification: %s", title)
 
-        # Send push notification
         if should_push:
             try:
                 await self._send_push(full_title, message)
@@ -134,40 +317,52 @@ class NotificationService:
                 results["push_error"] = str(err)
                 _LOGGER.error("Failed to send push notification: %s", err)
 
-        # Send email notification
-        if should_email:
+        return results
+
+    async def _async_email_worker(self) -> None:
+        """Send queued emails one at a time for the lifetime of the service."""
+        queue = self._email_queue
+        while True:
+            title, message, level = await queue.get()
             try:
-                await self._send_email(full_title, message, level)
-                results["email_sent"] = True
+                await self._send_email(title, message, level)
                 _LOGGER.info("Email notification sent: %s", title)
             except Exception as err:
-                results["email_error"] = str(err)
                 _LOGGER.error("Failed to send email notification: %s", err)
-
-        return results
+            finally:
+                queue.task_done()
 
     async def _send_push(self, title: str, message: str) -> None:
         """Send push notification via Home Assistant notify service."""
         # Use persistent_notification as fallback, or mobile_app if available
-        # First try to find mobile app notify services
-        notify_services = [
-            service
-            for service in self.hass.services.async_services().get("notify", {})
-            if service.startswith("mobile_app_")
-        ]
+        notify_services = self._get_mobile_services()
 
         if notify_services:
-            # Send to all mobile app services
-            for service_name in notify_services:
-                await self.hass.services.async_call(
-                    "notify",
-                    service_name,
-                    {
-                        "title": title,
-                        "message": message,
-                    },
-                    blocking=True,
-                )
+            # Send to all mobile app services at once, so latency is that of
+            # the slowest app rather than the sum; one failing app does not
+            # keep the others from being notified
+            service_data = {
+                "title": title,
+                "message": message,
+            }
+            results = await asyncio.gather(
+                *(
+                    self.hass.services.async_call(
+                        "notify", service_name, service_data, blocking=True
+                    )
+                    for service_name in notify_services
+                ),
+                return_exceptions=True,
+            )
+            errors = [
+                (service_name, result)
+                for service_name, result in zip(notify_services, results)
+                if isinstance(result, Exception)
+            ]
+            for service_name, err in errors:
+                _LOGGER.error("Push via notify.%s failed: %s", service_name, err)
+            if errors:
+                raise errors[0][1]
         else:
             # Fallback to persistent notification
             await self.hass.services.async_call(
@@ -176,7 +371,7 @@ class NotificationService:
                 {
                     "title": title,
                     "message": message,
-                    "notification_id": f"homie_main_{hash(title + message) % 10000}",
+                    "notification_id": _notification_id(title, message),
                 },
                 blocking=True,
             )
@@ -202,7 +397,7 @@ class NotificationService:
             return
 
         # Create email
-        msg = MIMEMultipart("alternative")
+        msg = EmailMessage()
         msg["Subject"] = title
         msg["From"] = smtp_username
         msg["To"] = ", ".join(recipients)
@@ -210,42 +405,33 @@ class NotificationService:
         # Plain text version
         text_content = f"{title}\n\n{message}\n\n---\nAutomatisch verzonden vanuit Homie, a.u.b. niet reageren."
 
-        # HTML version with black/white styling
-        html_content = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif; padding: 20px; color: #000;">
-            <p style="color: #666; font-size: 11px; margin-bottom: 20px;">
-                This is an auto-generated email, please do not reply.
-            </p>
-            <div style="border-left: 4px solid #000; padding-left: 15px;">
-                <h2 style="color: #000; margin: 0 0 10px 0;">{title}</h2>
-                <p style="color: #333; line-height: 1.6;">{message}</p>
-            </div>
-            <hr style="border: none; border-top: 1px solid #ccc; margin: 20px 0;">
-            <p style="color: #999; font-size: 12px;">
-                Automatisch verzonden vanuit Homie, a.u.b. niet reageren.
-            </p>
-        </body>
-        </html>
-        """
-
-        msg.attach(MIMEText(text_content, "plain"))
-        msg.attach(MIMEText(html_content, "html"))
-
-        # Send email in executor to not block
-        await self.hass.async_add_executor_job(
-            self._send_email_sync,
-            smtp_host,
-            smtp_port,
-            smtp_ssl,
-            smtp_starttls,
-            smtp_username,
-            smtp_password,
-            recipients,
-            msg,
+        # HTML version; title and message may carry calendar-derived text
+        html_content = EMAIL_HTML_TEMPLATE.format(
+            title=html.escape(title), message=html.escape(message)
         )
 
-    def _send_email_sync(
+        # Plain text body with the HTML version as multipart/alternative
+        msg.set_content(text_content)
+        msg.add_alternative(html_content, subtype="html")
+
+        # The lock keeps the shared SMTP session to one sender at a time
+        async with self._smtp_lock:
+            client = await self._get_smtp_client(
+                smtp_host, smtp_port, smtp_ssl, smtp_starttls, smtp_username, smtp_password
+            )
+            try:
+                await client.send_message(msg, sender=smtp_username, recipients=recipients)
+            except aiosmtplib.SMTPServerDisconnected:
+                # Server dropped the reused session between the check and the send
+                await self._close_smtp_client()
+                client = await self._get_smtp_client(
+                    smtp_host, smtp_port, smtp_ssl, smtp_starttls, smtp_username, smtp_password
+                )
+                await client.send_message(msg, sender=smtp_username, recipients=recipients)
+            self._smtp_last_used = time.monotonic()
+            self._smtp_messages += 1
+
+    async def _get_smtp_client(
         self,
         host: str,
         port: int,
@@ -253,21 +439,51 @@ class NotificationService:
         use_starttls: bool,
         username: str,
         password: str,
-        recipients: list[str],
-        msg: MIMEMultipart,
-    ) -> None:
-        """Send email synchronously (called from executor)."""
-        context = ssl.create_default_context()
-
-        if use_ssl:
-            # SSL connection from the start
-            with smtplib.SMTP_SSL(host, port, context=context) as server:
-                server.login(username, password)
-                server.sendmail(username, recipients, msg.as_string())
-        else:
-            # Plain connection, optionally upgrade to TLS
-            with smtplib.SMTP(host, port) as server:
-                if use_starttls:
-                    server.starttls(context=context)
-                server.login(username, password)
-                server.sendmail(username, recipients, msg.as_string())
+    ) -> aiosmtplib.SMTP:
+        """Return a logged-in SMTP client, reusing the previous session while fresh.
+
+        Called with the SMTP lock held.
+        """
+        key = (host, port, use_ssl, use_starttls, username)
+        client = self._smtp
+        if (
+            client is not None
+            and client.is_connected
+            and self._smtp_key == key
+            and self._smtp_messages < SMTP_MAX_MESSAGES_PER_SESSION
+            and time.monotonic() - self._smtp_last_used < SMTP_IDLE_TIMEOUT
+        ):
+            try:
+                if (await client.noop()).code == 250:
+                    return client
+            except aiosmtplib.SMTPException:
+                pass
+        await self._close_smtp_client()
+
+        # SSL from the start, or a plain connection optionally upgraded to TLS;
+        # connect() logs in with the given credentials
+        client = aiosmtplib.SMTP(
+            hostname=host,
+            port=port,
+            username=username,
+            password=password,
+            use_tls=use_ssl,
+            start_tls=use_starttls and not use_ssl,
+            tls_context=client_context(),
+        )
+        await client.connect()
+
+        self._smtp = client
+        self._smtp_key = key
+        self._smtp_messages = 0
+        return client
+
+    async def _close_smtp_client(self) -> None:
+        """Close the reused SMTP session, if any."""
+        client, self._smtp = self._smtp, None
+        if client is None or not client.is_connected:
+            return
+        try:
+            await client.quit()
+        except aiosmtplib.SMTPException:
+            client.close()
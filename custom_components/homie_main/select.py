@@ -17,12 +17,22 @@ from .const import (
     HOME_STATUS_OPTIONS_BUSINESS,
     VISUALIZATION_OPTIONS,
     OPERATING_MODES,
+    OP_MODE_ACTIVE,
+    OP_MODE_STANDBY,
+    OP_MODE_HIBERNATION,
     LOCATION_BUSINESS,
 )
 from .coordinator import HomieMainCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Operating mode to icon mapping
+OPERATING_MODE_ICONS = {
+    OP_MODE_ACTIVE: "mdi:home-lightning-bolt",
+    OP_MODE_STANDBY: "mdi:home-clock",
+    OP_MODE_HIBERNATION: "mdi:home-sleep",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -126,14 +136,7 @@ class HMOperatingModeSelect(HMBaseSelect):
     @property
     def icon(self) -> str:
         """Return icon based on operating mode."""
-        mode = self.coordinator.data.operating_mode
-        if mode == "Active":
-            return "mdi:home-lightning-bolt"
-        elif mode == "Stand-by":
-            return "mdi:home-clock"
-        elif mode == "Hibernation":
-            return "mdi:home-sleep"
-        return "mdi:home"
+        return OPERATING_MODE_ICONS.get(self.coordinator.data.operating_mode, "mdi:home")
 
     async def async_select_option(self, option: str) -> None:
         """Handle option selection (manual override)."""
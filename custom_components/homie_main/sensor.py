@@ -4,7 +4,8 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -15,9 +16,14 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.helpers.event import async_track_state_change_event, async_track_time_interval
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+    async_track_time_change,
+)
 from homeassistant.util import dt as dt_util
 
 from .const import (
@@ -33,24 +39,49 @@ from .const import (
     CONF_KPI_SOLAR_POWER,
     CONF_KPI_SOLAR_DAY_ENERGY,
     CONF_KPI_PURCHASE_PRICE,
-    CONF_KPI_FORECAST_USE,
-    CONF_KPI_SOLAR_FORECAST,
-    CONF_GPS_ENTITIES,
-    CONF_PING_ENTITIES,
-    CONF_MOTION_ENTITIES,
-    CONF_CALENDAR_ENTITIES,
-    CONF_USE_GPS,
-    CONF_USE_WIFI,
-    CONF_USE_MOTION,
-    CONF_USE_CALENDAR,
 )
 from .coordinator import HomieMainCoordinator
 
 # Data gap threshold in seconds (1 hour)
 DATA_GAP_THRESHOLD = 3600
 
+# Coalesce bursts of monitored state changes into one state write (seconds)
+DATA_GAP_WRITE_COOLDOWN = 0.25
+
+# States that count as a data gap
+_UNAVAILABLE_STATES = frozenset((STATE_UNAVAILABLE, STATE_UNKNOWN))
+
 _LOGGER = logging.getLogger(__name__)
 
+# Data gap sensor definitions:
+# (key, name, coordinator property with monitored entities, warning NL, warning EN)
+DATA_GAP_SENSOR_DEFINITIONS = [
+    # PRD Output 11 - presence entities (GPS, WiFi, Motion; enabled methods only)
+    (
+        "hm_warning_data_gap_presence",
+        "Warning Data Gap Presence",
+        "presence_monitored_entities",
+        "Waarschuwing: 1 of meerdere data voor presence is onbeschikbaar",
+        "Warning: One or more presence data sources unavailable",
+    ),
+    # PRD Output 12 - calendar entities
+    (
+        "hm_warning_data_gap_calendar",
+        "Warning Data Gap Calendar",
+        "calendar_monitored_entities",
+        "Waarschuwing: Agenda data is onbeschikbaar",
+        "Warning: Calendar data unavailable",
+    ),
+    # PRD Output 13 - main KPI entities (H-N)
+    (
+        "hm_warning_data_gap_main",
+        "Warning Data Gap Main",
+        "kpi_monitored_entities",
+        "Waarschuwing: 1 of meerdere KPI data inputs onbeschikbaar",
+        "Warning: One or more KPI data inputs unavailable",
+    ),
+]
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -72,12 +103,23 @@ async def async_setup_entry(
         HMWeatherTemperatureSensor(coordinator, entry),
         HMWeatherWindSensor(coordinator, entry),
         HMWeatherSolarSensor(coordinator, entry),
-        # Data gap warning notifications (PRD Output 11-12-13)
-        HMWarningDataGapPresenceSensor(coordinator, entry, hass),
-        HMWarningDataGapCalendarSensor(coordinator, entry, hass),
-        HMWarningDataGapMainSensor(coordinator, entry, hass),
     ]
 
+    # Data gap warning notifications (PRD Output 11-12-13)
+    entities.extend(
+        HMDataGapSensor(
+            coordinator,
+            entry,
+            hass,
+            key,
+            name,
+            getattr(coordinator, monitored_attr),
+            warning_nl,
+            warning_en,
+        )
+        for key, name, monitored_attr, warning_nl, warning_en in DATA_GAP_SENSOR_DEFINITIONS
+    )
+
     async_add_entities(entities)
     _LOGGER.info("Added %d Homie Main sensors", len(entities))
 
@@ -157,10 +199,12 @@ class HMManualOverrideUntilSensor(HMBaseSensor):
         self._attr_icon = "mdi:clock-outline"
 
     @property
-    def native_value(self) -> str | None:
+    def native_value(self) -> datetime | None:
         """Return when manual override expires."""
-        if self.coordinator.data.manual_override.active and self.coordinator.data.manual_override.expires_at:
-            return self.coordinator.data.manual_override.expires_at.isoformat()
+        # TIMESTAMP sensors take the aware datetime directly; HA serialises it
+        override = self.coordinator.data.manual_override
+        if override.active:
+            return override.expires_at
         return None
 
 
@@ -223,9 +267,13 @@ class HMPriceDayCurveSensor(HMBaseSensor):
     async def async_added_to_hass(self) -> None:
         """Start the period-check timer."""
         await super().async_added_to_hass()
-        self._unsub_timer = async_track_time_interval(
-            self.hass, self._check_period, timedelta(seconds=30)
+        # Periods are hourly or 15-min, so every boundary falls on a quarter
+        # hour; waking only then replaces a fixed 30 s poll
+        self._unsub_timer = async_track_time_change(
+            self.hass, self._check_period, minute="/15", second=0
         )
+        # Pick up the current period now rather than at the next boundary
+        self._check_period(dt_util.now())
 
     async def async_will_remove_from_hass(self) -> None:
         """Cancel the timer."""
@@ -236,27 +284,6 @@ class HMPriceDayCurveSensor(HMBaseSensor):
 
     # -- helpers -----------------------------------------------------------
 
-    @staticmethod
-    def _parse_prices(raw: list) -> list[float | None]:
-        """Parse a purchase_prices list into a time-sorted price list."""
-        entries: list[tuple[datetime, float]] = []
-        for item in raw:
-            if not isinstance(item, dict):
-                continue
-            start_str = item.get("start")
-            price = item.get("price")
-            if start_str is None or price is None:
-                continue
-            try:
-                ts = dt_util.parse_datetime(start_str)
-                if ts is None:
-                    continue
-                entries.append((ts, float(price)))
-            except (ValueError, TypeError):
-                continue
-        entries.sort(key=lambda e: e[0])
-        return [p for _, p in entries]
-
     @staticmethod
     def _period_index(n: int) -> int:
         """Return the current period index (0..n-1) based on clock time."""
@@ -272,8 +299,8 @@ class HMPriceDayCurveSensor(HMBaseSensor):
     def _check_period(self, _now: datetime) -> None:
         """Write state when the period index or source (today/tomorrow) changes."""
         ps = self.coordinator.data.price_series_state
-        today = self._parse_prices(ps.purchase_prices_today)
-        tomorrow = self._parse_prices(ps.purchase_prices_tomorrow)
+        today = ps.prices_today
+        tomorrow = ps.prices_tomorrow
         n = len(today) or len(tomorrow) or 1
         idx = self._period_index(n)
         is_wa = bool(tomorrow)
@@ -289,8 +316,8 @@ class HMPriceDayCurveSensor(HMBaseSensor):
     def native_value(self) -> float | None:
         """Return the write-ahead price (tomorrow if available, else today)."""
         ps = self.coordinator.data.price_series_state
-        tomorrow = self._parse_prices(ps.purchase_prices_tomorrow)
-        today = self._parse_prices(ps.purchase_prices_today)
+        tomorrow = ps.prices_tomorrow
+        today = ps.prices_today
         n = len(today) or len(tomorrow) or 1
         idx = self._period_index(n)
 
@@ -304,8 +331,8 @@ class HMPriceDayCurveSensor(HMBaseSensor):
     def extra_state_attributes(self) -> dict[str, Any]:
         """Expose day-curve metadata."""
         ps = self.coordinator.data.price_series_state
-        today = self._parse_prices(ps.purchase_prices_today)
-        tomorrow = self._parse_prices(ps.purchase_prices_tomorrow)
+        today = ps.prices_today
+        tomorrow = ps.prices_tomorrow
         is_wa = bool(tomorrow)
         # Use tomorrow's prices for min/max when in write-ahead mode
         active = tomorrow if is_wa else today
@@ -547,8 +574,8 @@ class HMWeatherSolarSensor(HMBaseSensor):
 # Data Gap Warning Sensors (PRD Output 11-12-13)
 # =============================================================================
 
-class HMDataGapBaseSensor(CoordinatorEntity[HomieMainCoordinator], SensorEntity):
-    """Base class for data gap warning sensors."""
+class HMDataGapSensor(CoordinatorEntity[HomieMainCoordinator], SensorEntity):
+    """Data gap warning sensor, configured from DATA_GAP_SENSOR_DEFINITIONS."""
 
     _attr_has_entity_name = False
 
@@ -559,6 +586,9 @@ class HMDataGapBaseSensor(CoordinatorEntity[HomieMainCoordinator], SensorEntity)
         hass: HomeAssistant,
         key: str,
         name: str,
+        monitored_entities: tuple[str, ...],
+        warning_nl: str,
+        warning_en: str,
     ) -> None:
         """Initialize the data gap sensor."""
         super().__init__(coordinator)
@@ -568,11 +598,31 @@ class HMDataGapBaseSensor(CoordinatorEntity[HomieMainCoordinator], SensorEntity)
         self._attr_name = name
         self._attr_icon = "mdi:alert-circle-outline"
         self._key = key
+        self._monitored_entities = monitored_entities
+        self._warning_nl = warning_nl
+        self._warning_en = warning_en
 
         # Track when each entity became unavailable
-        self._unavailable_since: dict[str, datetime | None] = {}
+        # (monotonic seconds, immune to wall-clock jumps)
+        self._unavailable_since: dict[str, float | None] = {}
         self._unsubscribe_listeners: list = []
 
+        # Last data gap result, valid until a monitored entity changes or the
+        # next unavailable entity crosses the threshold (None = no deadline)
+        self._gap_result: tuple[bool, list[str]] | None = None
+        self._gap_result_expires: float | None = None
+        self._unsub_gap_expiry: callback | None = None
+
+        # First change is written immediately, further changes within the
+        # cooldown are folded into a single trailing write
+        self._write_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=DATA_GAP_WRITE_COOLDOWN,
+            immediate=True,
+            function=self.async_write_ha_state,
+        )
+
         # Device info
         self._attr_device_info = {
             "identifiers": {(DOMAIN, entry.entry_id)},
@@ -582,51 +632,49 @@ class HMDataGapBaseSensor(CoordinatorEntity[HomieMainCoordinator], SensorEntity)
             "sw_version": "0.1.0",
         }
 
-    def _get_monitored_entities(self) -> list[str]:
-        """Return list of entities to monitor. Override in subclass."""
-        return []
-
-    def _get_warning_message_nl(self) -> str:
-        """Return Dutch warning message. Override in subclass."""
-        return "Data onbeschikbaar"
-
-    def _get_warning_message_en(self) -> str:
-        """Return English warning message. Override in subclass."""
-        return "Data unavailable"
-
     async def async_added_to_hass(self) -> None:
         """Subscribe to entity state changes when added to hass."""
         await super().async_added_to_hass()
 
-        entities = self._get_monitored_entities()
+        entities = self._monitored_entities
         if entities:
-            # Initialize unavailable tracking for current states
+            # Initialize unavailable tracking for current states, stamping
+            # every initially unavailable entity with the same timestamp
+            now = time.monotonic()
+            get_state = self._hass.states.get
             for entity_id in entities:
-                state = self._hass.states.get(entity_id)
-                if state and state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
-                    self._unavailable_since[entity_id] = dt_util.utcnow()
+                state = get_state(entity_id)
+                if state and state.state in _UNAVAILABLE_STATES:
+                    self._unavailable_since[entity_id] = now
                 else:
                     self._unavailable_since[entity_id] = None
 
+            # Bind what the listener needs as closure locals, so each event
+            # avoids repeated attribute lookups on self
+            unavailable_since = self._unavailable_since
+            schedule_write = self._write_debouncer.async_schedule_call
+
             # Subscribe to state changes
             @callback
             def _state_change_listener(event):
                 """Handle state changes."""
-                entity_id = event.data.get("entity_id")
-                new_state = event.data.get("new_state")
+                data = event.data
+                entity_id = data.get("entity_id")
+                new_state = data.get("new_state")
 
-                if entity_id not in self._unavailable_since:
-                    return
+                # No membership check needed: async_track_state_change_event only
+                # dispatches events for the entities it was subscribed with
+                self._gap_result = None
 
-                if new_state is None or new_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+                if new_state is None or new_state.state in _UNAVAILABLE_STATES:
                     # Entity became unavailable
-                    if self._unavailable_since.get(entity_id) is None:
-                        self._unavailable_since[entity_id] = dt_util.utcnow()
+                    if unavailable_since.get(entity_id) is None:
+                        unavailable_since[entity_id] = time.monotonic()
                 else:
                     # Entity became available again
-                    self._unavailable_since[entity_id] = None
+                    unavailable_since[entity_id] = None
 
-                self.async_write_ha_state()
+                schedule_write()
 
             unsub = async_track_state_change_event(
                 self._hass,
@@ -640,19 +688,58 @@ class HMDataGapBaseSensor(CoordinatorEntity[HomieMainCoordinator], SensorEntity)
         for unsub in self._unsubscribe_listeners:
             unsub()
         self._unsubscribe_listeners.clear()
+        self._cancel_gap_expiry()
+        self._write_debouncer.async_shutdown()
 
     def _check_data_gap(self) -> tuple[bool, list[str]]:
         """Check if any monitored entity has been unavailable for > 1 hour."""
-        now = dt_util.utcnow()
-        threshold = timedelta(seconds=DATA_GAP_THRESHOLD)
+        now = time.monotonic()
+        result = self._gap_result
+        if result is not None and (
+            self._gap_result_expires is None or now <= self._gap_result_expires
+        ):
+            return result
+
+        # Single pass: anything unavailable since before the cutoff is a gap,
+        # the earliest remaining start sets when this result next changes
+        cutoff = now - DATA_GAP_THRESHOLD
         gap_entities = []
+        earliest: float | None = None
 
         for entity_id, unavailable_time in self._unavailable_since.items():
-            if unavailable_time is not None:
-                if now - unavailable_time > threshold:
-                    gap_entities.append(entity_id)
+            if unavailable_time is None:
+                continue
+            if unavailable_time < cutoff:
+                gap_entities.append(entity_id)
+            elif earliest is None or unavailable_time < earliest:
+                earliest = unavailable_time
+
+        expires = None if earliest is None else earliest + DATA_GAP_THRESHOLD
+
+        result = (len(gap_entities) > 0, gap_entities)
+        self._gap_result = result
+        self._gap_result_expires = expires
+
+        # Nothing else is guaranteed to write state when the result expires,
+        # so wake up for it
+        self._cancel_gap_expiry()
+        if expires is not None:
+            self._unsub_gap_expiry = async_call_later(
+                self._hass, expires - now, self._handle_gap_expiry
+            )
+        return result
 
-        return len(gap_entities) > 0, gap_entities
+    def _cancel_gap_expiry(self) -> None:
+        """Cancel the pending data gap expiry wake-up."""
+        if self._unsub_gap_expiry:
+            self._unsub_gap_expiry()
+            self._unsub_gap_expiry = None
+
+    @callback
+    def _handle_gap_expiry(self, _now: datetime) -> None:
+        """Write state once an unavailable entity crosses the threshold."""
+        self._unsub_gap_expiry = None
+        self.async_write_ha_state()
 
     @property
     def native_value(self) -> str:
@@ -662,8 +749,8 @@ class HMDataGapBaseSensor(CoordinatorEntity[HomieMainCoordinator], SensorEntity)
             # Get language from HA config
             lang = self._hass.config.language if hasattr(self._hass.config, 'language') else "en"
             if lang == "nl":
-                return self._get_warning_message_nl()
-            return self._get_warning_message_en()
+                return self._warning_nl
+            return self._warning_en
         return "off"
 
     @property
@@ -674,127 +761,7 @@ class HMDataGapBaseSensor(CoordinatorEntity[HomieMainCoordinator], SensorEntity)
             "tag": "Homie",
             "category": "warning",
             "severity": "warning" if has_gap else "none",
-            "monitored_entities": self._get_monitored_entities(),
+            "monitored_entities": self._monitored_entities,
             "unavailable_entities": gap_entities,
             "threshold_hours": DATA_GAP_THRESHOLD / 3600,
         }
-
-
-class HMWarningDataGapPresenceSensor(HMDataGapBaseSensor):
-    """Warning sensor for presence data gaps (PRD Output 11)."""
-
-    def __init__(
-        self,
-        coordinator: HomieMainCoordinator,
-        entry: ConfigEntry,
-        hass: HomeAssistant,
-    ) -> None:
-        """Initialize the presence data gap sensor."""
-        super().__init__(
-            coordinator,
-            entry,
-            hass,
-            "hm_warning_data_gap_presence",
-            "Warning Data Gap Presence",
-        )
-
-    def _get_monitored_entities(self) -> list[str]:
-        """Return presence entities to monitor (GPS, WiFi, Motion)."""
-        entities = []
-        config = self.coordinator.config
-
-        # Only monitor enabled presence methods
-        if config.get(CONF_USE_GPS, False):
-            entities.extend(config.get(CONF_GPS_ENTITIES, []))
-        if config.get(CONF_USE_WIFI, False):
-            entities.extend(config.get(CONF_PING_ENTITIES, []))
-        if config.get(CONF_USE_MOTION, False):
-            entities.extend(config.get(CONF_MOTION_ENTITIES, []))
-
-        return entities
-
-    def _get_warning_message_nl(self) -> str:
-        return "Waarschuwing: 1 of meerdere data voor presence is onbeschikbaar"
-
-    def _get_warning_message_en(self) -> str:
-        return "Warning: One or more presence data sources unavailable"
-
-
-class HMWarningDataGapCalendarSensor(HMDataGapBaseSensor):
-    """Warning sensor for calendar data gaps (PRD Output 12)."""
-
-    def __init__(
-        self,
-        coordinator: HomieMainCoordinator,
-        entry: ConfigEntry,
-        hass: HomeAssistant,
-    ) -> None:
-        """Initialize the calendar data gap sensor."""
-        super().__init__(
-            coordinator,
-            entry,
-            hass,
-            "hm_warning_data_gap_calendar",
-            "Warning Data Gap Calendar",
-        )
-
-    def _get_monitored_entities(self) -> list[str]:
-        """Return calendar entities to monitor."""
-        config = self.coordinator.config
-        if config.get(CONF_USE_CALENDAR, False):
-            return config.get(CONF_CALENDAR_ENTITIES, [])
-        return []
-
-    def _get_warning_message_nl(self) -> str:
-        return "Waarschuwing: Agenda data is onbeschikbaar"
-
-    def _get_warning_message_en(self) -> str:
-        return "Warning: Calendar data unavailable"
-
-
-class HMWarningDataGapMainSensor(HMDataGapBaseSensor):
-    """Warning sensor for main KPI data gaps (PRD Output 13)."""
-
-    def __init__(
-        self,
-        coordinator: HomieMainCoordinator,
-        entry: ConfigEntry,
-        hass: HomeAssistant,
-    ) -> None:
-        """Initialize the main KPI data gap sensor."""
-        super().__init__(
-            coordinator,
-            entry,
-            hass,
-            "hm_warning_data_gap_main",
-            "Warning Data Gap Main",
-        )
-
-    def _get_monitored_entities(self) -> list[str]:
-        """Return main KPI entities to monitor (H-M from PRD)."""
-        entities = []
-        config = self.coordinator.config
-
-        # KPI sensors (H-M in PRD)
-        kpi_keys = [
-            CONF_KPI_POWER_USE,        # H - Total power use
-            CONF_KPI_DAY_ENERGY_USE,   # I - Total daily energy use
-            CONF_KPI_SOLAR_POWER,      # J - Total production
-            CONF_KPI_FORECAST_USE,     # K - Total forecasted use
-            CONF_KPI_SOLAR_DAY_ENERGY, # L - Total daily production
-            CONF_KPI_SOLAR_FORECAST,   # M - Forecast solar
-            CONF_KPI_PURCHASE_PRICE,   # N - Purchase price
-        ]
-
-        for key in kpi_keys:
-            entity_id = config.get(key)
-            if entity_id:
-                entities.append(entity_id)
-
-        return entities
-
-    def _get_warning_message_nl(self) -> str:
-        return "Waarschuwing: 1 of meerdere KPI data inputs onbeschikbaar"
-
-    def _get_warning_message_en(self) -> str:
-        return "Warning: One or more KPI data inputs unavailable"
@@ -104,6 +104,11 @@ class HMConfigSwitch(SwitchEntity):
         self._attr_unique_id = f"{entry.entry_id}_{key}"
         self._attr_name = name
         self._attr_icon = icon
+        # Fixed per switch, so built once instead of on every state write
+        self._attr_extra_state_attributes = {
+            "category": category,
+            "config_key": key,
+        }
 
         # Device info for grouping
         self._attr_device_info = {
@@ -117,17 +122,12 @@ class HMConfigSwitch(SwitchEntity):
     @property
     def is_on(self) -> bool:
         """Return true if switch is on."""
-        # Read from config entry (data + options merged)
-        current = {**self._entry.data, **self._entry.options}
-        return current.get(self._key, self._default)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        return {
-            "category": self._category,
-            "config_key": self._key,
-        }
+        # Read from config entry; options take precedence over data, looked
+        # up directly rather than through a merged copy of both mappings
+        options = self._entry.options
+        if self._key in options:
+            return options[self._key]
+        return self._entry.data.get(self._key, self._default)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
@@ -149,7 +149,7 @@ class HMConfigSwitch(SwitchEntity):
         )
 
         # Update coordinator config cache
-        self._coordinator.config[self._key] = value
+        self._coordinator.set_config_value(self._key, value)
 
         # Write state to HA
         self.async_write_ha_state()